@@ -40,6 +40,8 @@ def calculate_one_out_of_two(
     beta_d = assumptions.beta_D
     ti = assumptions.TI
     mttr = assumptions.MTTR
+    # Mean DU down time, shared by the independent and the CCF terms.
+    t_du = ti / 2.0 + mttr
 
     lam_du_ind = (1.0 - beta) * lam_du_total
     lam_dd_ind = (1.0 - beta_d) * lam_dd_total
@@ -48,7 +50,7 @@ def calculate_one_out_of_two(
     if lam_d_ind > 0.0:
         w_du = lam_du_ind / lam_d_ind
         w_dd = lam_dd_ind / lam_d_ind
-        t_ce = w_du * (ti / 2.0 + mttr) + w_dd * mttr
+        t_ce = w_du * t_du + w_dd * mttr
         t_ge = w_du * (ti / 3.0 + mttr) + w_dd * mttr
         pfd_ind = 2.0 * (lam_d_ind**2) * t_ce * t_ge
         pfh_ind = 2.0 * lam_d_ind * lam_du_ind * t_ce
@@ -58,7 +60,7 @@ def calculate_one_out_of_two(
         pfd_ind = 0.0
         pfh_ind = 0.0
 
-    pfd_du_ccf = beta * lam_du_total * (ti / 2.0 + mttr)
+    pfd_du_ccf = beta * lam_du_total * t_du
     pfd_dd_ccf = beta_d * lam_dd_total * mttr
     pfh_ccf = beta * lam_du_total
 
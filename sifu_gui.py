@@ -13,7 +13,12 @@ import sys
 import re
 import uuid
 import copy
-from typing import Dict, Tuple, List, Optional, Union, Any, Set
+import io
+import tempfile
+from bisect import bisect_right
+from collections import defaultdict
+from functools import lru_cache, partial
+from typing import Callable, Dict, Tuple, List, Optional, Union, Any, Set, TextIO
 from PyQt5 import QtCore, QtWidgets
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
@@ -34,23 +39,114 @@ from sifu_core import (
     calculate_single_channel,
     compute_lambda_total,
 )
+
+# Bound once: item.data()/setData() role used for every chip payload.
+_USER_ROLE = Qt.UserRole
+
+# User-facing notes for λ_total values that were derived rather than entered natively.
+_PROVENANCE_NOTES: Dict[Optional[str], str] = {
+    "derived_from_pfh": "Data source: λ_total derived from PFH; DU/DD use the current settings.",
+    "derived_from_pfd": "Data source: λ_total derived from 2·PFD/TI using the current TI; DU/DD use the current settings.",
+}
 # ==========================
 
 
 def new_instance_id() -> str:
     return uuid.uuid4().hex
 
+
+def _pick(d: Dict[str, Any], key: str, fallback: str, default: Any = None) -> Any:
+    """``d.get(key, d.get(fallback, default))`` without the eager second lookup."""
+    return d[key] if key in d else d.get(fallback, default)
+
+
+def clone_payload(obj: Any) -> Any:
+    """Deep copy for the JSON-shaped chip payloads (dicts/lists of plain scalars)."""
+    if isinstance(obj, dict):
+        return {k: clone_payload(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [clone_payload(v) for v in obj]
+    return obj
+
 # ==========================
 # Tooltip helper (HTML)
 # ==========================
 
+# Same replacements as html.escape(quote=True), applied in one str.translate pass.
+_ESC_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+
+def escape_html(x: Any) -> str:
+    return "" if x is None else str(x).translate(_ESC_TABLE)
+
+
+def _fmt_optional_pfd(value: Optional[float]) -> str:
+    if value is None:
+        return ""
+    try:
+        return f"PFDavg {float(value):.6f}"
+    except Exception:
+        return ""
+
+
+def _fmt_optional_pfh(value: Optional[float]) -> str:
+    if value is None:
+        return ""
+    try:
+        return f"PFHavg {float(value):.3e} 1/h"
+    except Exception:
+        return ""
+
+
+def _result_tooltip_text(header_lines: List[str], combined_groups: List[Dict[str, Any]]) -> str:
+    """Text of a row's result-cell tooltip: SIL summary plus one block per link subgroup."""
+    lines = list(header_lines)
+    if combined_groups:
+        lines.extend(("", "Link subgroups:"))
+    for idx, subgroup in enumerate(combined_groups, 1):
+        if not isinstance(subgroup, dict):
+            continue
+        header_bits = [f"  Subgroup {idx}"]
+        lanes = subgroup.get('lanes')
+        if isinstance(lanes, (list, tuple)) and lanes:
+            header_bits.append(f"[{', '.join(str(l) for l in lanes if l)}]")
+        lines.append(" ".join(header_bits))
+
+        metric_bits: List[str] = []
+        pfd_txt = _fmt_optional_pfd(subgroup.get('pfd'))
+        if pfd_txt:
+            metric_bits.append(pfd_txt)
+        pfh_txt = _fmt_optional_pfh(subgroup.get('pfh'))
+        if pfh_txt:
+            metric_bits.append(pfh_txt)
+        if metric_bits:
+            lines.append("    " + " | ".join(metric_bits))
+
+        members = subgroup.get('member_labels')
+        if not members:
+            members = [
+                comp.get('label')
+                for comp in subgroup.get('components', [])
+                if comp.get('label')
+            ]
+        if members:
+            # member_labels / component labels are built as str in _sum_lists.
+            lines.append("    Members: " + ", ".join(filter(None, members)))
+    return "\n".join(lines)
+
+
 def make_html_tooltip(title: str, pfd: Optional[float], pfh: Optional[float], syscap: Any,
                       pdm_code: str = "", pfh_entered_fit: Optional[float] = None,
                       pfd_entered_fit: Optional[float] = None,
                       extra_fields: Optional[Dict[str, Any]] = None,
                       note: Optional[str] = None) -> str:
-    def esc(x: Any) -> str:
-        return html.escape("" if x is None else str(x))
+    esc = escape_html
 
     def fmt_pfd(x): return "–" if x is None else f"{float(x):.6f}"
     def fmt_pfh(x): return "–" if x is None else f"{float(x):.3e} 1/h"
@@ -218,7 +314,11 @@ class ConfigDialog(QDialog):
             du_dd[group] = ((du / tot, dd / tot) if tot > 0 else (0.6, 0.4))
         return values, du_dd
 
-class NumpySafeDumper(yaml.SafeDumper):
+# libyaml's emitter/parser when PyYAML was built with it; same results, much faster on big projects
+_SafeDumperBase = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+class NumpySafeDumper(_SafeDumperBase):
     def represent_data(self, data):
         if isinstance(data, (np.integer, np.floating)):
             return super().represent_data(data.item())
@@ -247,23 +347,24 @@ def load_sifu_dataframe():
 # SIL helpers (unchanged math)
 # ==========================
 
+# Decade band edges; bisect_right(edges, x) == i means edges[i-1] <= x < edges[i].
+_SIL_BAND_LABELS = ("n.a.", "SIL 4", "SIL 3", "SIL 2", "SIL 1", "n.a.")
+_PFH_EDGES = (1e-9, 1e-8, 1e-7, 1e-6, 1e-5)
+_PFD_EDGES = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1)
+
 def classify_sil_from_pfh(pfh_sum: float) -> str:
-    if 1e-9 <= pfh_sum < 1e-8: return "SIL 4"
-    if 1e-8 <= pfh_sum < 1e-7: return "SIL 3"
-    if 1e-7 <= pfh_sum < 1e-6: return "SIL 2"
-    if 1e-6 <= pfh_sum < 1e-5: return "SIL 1"
-    return "n.a."
+    return _SIL_BAND_LABELS[bisect_right(_PFH_EDGES, pfh_sum)]
 
 def classify_sil_from_pfd(pfd_sum: float) -> str:
-    if 1e-5 <= pfd_sum < 1e-4: return "SIL 4"
-    if 1e-4 <= pfd_sum < 1e-3: return "SIL 3"
-    if 1e-3 <= pfd_sum < 1e-2: return "SIL 2"
-    if 1e-2 <= pfd_sum < 1e-1: return "SIL 1"
-    return "n.a."
+    return _SIL_BAND_LABELS[bisect_right(_PFD_EDGES, pfd_sum)]
+
+_SIL_DIGIT_RE = re.compile(r"\b([1-4])\b")
 
+# Only a handful of distinct labels ("SIL 2", "n.a.", ...) ever reach this, so it is memoized.
+@lru_cache(maxsize=64)
 def sil_rank(s: str) -> int:
     s = (s or "").strip().upper()
-    m = re.search(r"\b([1-4])\b", s)
+    m = _SIL_DIGIT_RE.search(s)
     if not m: return 0
     n = int(m.group(1))
     return n if 1 <= n <= 4 else 0
@@ -277,6 +378,52 @@ def normalize_required_sil(val: Union[str, int, float]) -> Tuple[str, int]:
         return (f"SIL {r}", r) if r else ("n.a.", 0)
     return ("n.a.", 0)
 
+@lru_cache(maxsize=32)
+def demand_mode_key(mode: str) -> str:
+    """Map a demand-mode label ('High demand' / 'Low demand') to the engine's mode key."""
+    return "low_demand" if "low" in mode.lower() else "high_demand"
+
+def _new_subgroup_entry() -> Dict[str, Any]:
+    """Zeroed accumulator for one link subgroup in MainWindow._sum_lists."""
+    return {'color': None, 'pfd': 0.0, 'pfh': 0.0, 'components': [], 'lanes': 0}
+
+# ==========================
+# Colour helpers
+# ==========================
+
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+def is_hex_color(value: str) -> bool:
+    """True for '#rgb', '#rrggbb' and '#rrggbbaa' (case-insensitive)."""
+    return (len(value) in (4, 7, 9) and value[0] == '#'
+            and all(ch in _HEX_DIGITS for ch in value[1:]))
+
+@lru_cache(maxsize=512)
+def canonical_link_color(value: str) -> Optional[str]:
+    """Lower-case '#rrggbb[aa]' form of a link colour string, or None if it is not hex."""
+    candidate = value.strip()
+    if not candidate:
+        return None
+    if is_hex_color(candidate):
+        # Normalise to lowercase hex for stable comparisons
+        if len(candidate) == 4:  # short form like #abc
+            # Expand to 6-digit for consistency
+            r, g, b = candidate[1], candidate[2], candidate[3]
+            candidate = f"#{r}{r}{g}{g}{b}{b}"
+        return candidate.lower()
+    return None
+
+@lru_cache(maxsize=512)
+def canonical_link_group_id(group_id: str) -> Optional[str]:
+    """Strip whitespace and fold legacy 'row:lane:token' ids into 'row:token'."""
+    normalized = group_id.strip()
+    if not normalized:
+        return None
+    parts = normalized.split(":")
+    if len(parts) == 3 and parts[1] in {"sensor", "logic", "actuator"}:
+        return f"{parts[0]}:{parts[2]}"
+    return normalized
+
 # ==========================
 # Row metadata
 # ==========================
@@ -395,6 +542,18 @@ class ResultCell(QWidget):
         root.addWidget(card, 1)
 
         self.set_sil_badge("n.a.", None)
+        self._tooltip_builder: Optional[Callable[[], str]] = None
+
+    def set_lazy_tooltip(self, builder: Callable[[], str]) -> None:
+        """Defer building the tooltip text until Qt is about to show it."""
+        self._tooltip_builder = builder
+
+    def event(self, e) -> bool:
+        # Tooltip events of child labels without a tooltip propagate up to this cell.
+        if e.type() == QtCore.QEvent.ToolTip and self._tooltip_builder is not None:
+            self.setToolTip(self._tooltip_builder())
+            self._tooltip_builder = None
+        return super().event(e)
 
     def set_sil_badge(self, sil_text: str, requirement_met: Optional[bool]) -> None:
         sil_normalized = (sil_text or "").strip().upper()
@@ -581,7 +740,7 @@ class ChipList(QListWidget):
             for item in self.selectedItems():
                 self.takeItem(self.row(item))
             self.window().statusBar().showMessage("Removed component", 2000)
-            self.window().recalculate_all()
+            self.window()._schedule_recalculate()
         elif action == act_add:
             self.window().open_add_component_dialog(pref_kind=self.allowed_kind, insert_into_row=True)
         elif action == act_start_link and window:
@@ -677,7 +836,7 @@ class ChipList(QListWidget):
         self.setProperty("dragTarget", False)
         self.style().unpolish(self); self.style().polish(self)
         self.window().statusBar().showMessage("Moved component", 1500)
-        self.window().recalculate_all()
+        self.window()._schedule_recalculate()
 
     def mousePressEvent(self, event):
         window = self.window()
@@ -824,13 +983,13 @@ class ActuatorList(ChipList):
 
                     event.acceptProposedAction()
                     self.window().statusBar().showMessage("Created 1oo2 actuator group", 2000)
-                    self.window().recalculate_all()
+                    self.window()._schedule_recalculate()
                     return
 
         super().dropEvent(event)
         self.setProperty("dragTarget", False)
         self.style().unpolish(self); self.style().polish(self)
-        self.window().recalculate_all()
+        self.window()._schedule_recalculate()
 
 
 
@@ -897,13 +1056,13 @@ class SensorList(ChipList):
 
                     event.acceptProposedAction()
                     self.window().statusBar().showMessage("Created 1oo2 sensor group", 2000)
-                    self.window().recalculate_all()
+                    self.window()._schedule_recalculate()
                     return
 
         super().dropEvent(event)
         self.setProperty("dragTarget", False)
         self.style().unpolish(self); self.style().polish(self)
-        self.window().recalculate_all()
+        self.window()._schedule_recalculate()
 
 class SifuRowWidgets:
     """Container of column lists + result cell."""
@@ -913,6 +1072,10 @@ class SifuRowWidgets:
         self.out_list = ActuatorList(placeholder="Drop actuators here …\n(Double-click a library item to add)", allowed_kind="actuator")
         self.result = ResultCell()
 
+    def is_non_empty(self) -> bool:
+        """True if any lane holds at least one chip."""
+        return bool(self.in_list.count() or self.logic_list.count() or self.out_list.count())
+
 # ==========================
 # Generic Component Library Dock
 # ==========================
@@ -1060,7 +1223,7 @@ class ComponentLibraryDock(QDockWidget):
             return False
         try:
             with open(self.yaml_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_SafeLoader) or {}
         except Exception as e:
             QMessageBox.critical(self, "Load YAML", f"Could not load '{self.yaml_file}': {e}")
             return False
@@ -1117,10 +1280,10 @@ class ComponentLibraryDock(QDockWidget):
         self.list.clear()
 
         for comp in self.items_data:
-            name   = str(comp.get('name', comp.get('code', '?')))
-            pfd    = float(comp.get('pfd_avg', comp.get('pfd', 0.0)))
-            pfh    = float(comp.get('pfh_avg', comp.get('pfh', 0.0)))
-            syscap = comp.get('sys_cap', comp.get('syscap', ''))
+            name   = str(_pick(comp, 'name', 'code', '?'))
+            pfd    = float(_pick(comp, 'pfd_avg', 'pfd', 0.0))
+            pfh    = float(_pick(comp, 'pfh_avg', 'pfh', 0.0))
+            syscap = _pick(comp, 'sys_cap', 'syscap', '')
             pdm    = comp.get('pdm_code', '')
 
             item = QListWidgetItem(name)  # Text bleibt für Sortierung/Filter
@@ -1234,7 +1397,7 @@ class ComponentLibraryDock(QDockWidget):
             return False
         try:
             with open(self.yaml_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_SafeLoader) or {}
         except Exception as e:
             QMessageBox.critical(self, "Load YAML", f"Could not load '{self.yaml_file}': {e}")
             return False
@@ -1290,10 +1453,10 @@ class ComponentLibraryDock(QDockWidget):
         self.list.clear()
 
         for comp in self.items_data:
-            name   = str(comp.get('name', comp.get('code', '?')))
-            pfd    = float(comp.get('pfd_avg', comp.get('pfd', 0.0)))
-            pfh    = float(comp.get('pfh_avg', comp.get('pfh', 0.0)))
-            syscap = comp.get('sys_cap', comp.get('syscap', ''))
+            name   = str(_pick(comp, 'name', 'code', '?'))
+            pfd    = float(_pick(comp, 'pfd_avg', 'pfd', 0.0))
+            pfh    = float(_pick(comp, 'pfh_avg', 'pfh', 0.0))
+            syscap = _pick(comp, 'sys_cap', 'syscap', '')
             pdm    = comp.get('pdm_code', '')
 
             # 1) QListWidgetItem ohne sichtbaren Text (gegen Doppelanzeige)
@@ -1312,9 +1475,9 @@ class ComponentLibraryDock(QDockWidget):
                 **comp,                          # alle Original-Keys aus YAML
                 "name": name,
                 "code": name,
-                "pfd": pfd if "pfd" not in comp and "pfd_avg" not in comp else comp.get("pfd", comp.get("pfd_avg", pfd)),
-                "pfh": pfh if "pfh" not in comp and "pfh_avg" not in comp else comp.get("pfh", comp.get("pfh_avg", pfh)),
-                "syscap": syscap if "syscap" in comp or "sys_cap" not in comp else comp.get("syscap", comp.get("sys_cap", syscap)),
+                "pfd": pfd if "pfd" not in comp and "pfd_avg" not in comp else _pick(comp, "pfd", "pfd_avg", pfd),
+                "pfh": pfh if "pfh" not in comp and "pfh_avg" not in comp else _pick(comp, "pfh", "pfh_avg", pfh),
+                "syscap": syscap if "syscap" in comp or "sys_cap" not in comp else _pick(comp, "syscap", "sys_cap", syscap),
                 "pdm_code": pdm if "pdm_code" in comp else comp.get("pdm_code", pdm),
                 "kind": self.kind,
             }
@@ -1450,6 +1613,12 @@ class AddSifuDialog(QDialog):
         btns.accepted.connect(self.accept); btns.rejected.connect(self.reject)
         form.addRow(btns)
 
+    def reset(self) -> None:
+        """Back to the empty state, for reuse of the same dialog instance."""
+        self.ed_name.clear()
+        self.spin_sil.setValue(1)
+        self.combo_mode.setCurrentIndex(0)
+
     def get_values(self) -> RowMeta:
         sil_str = f"SIL {self.spin_sil.value()}"
         return RowMeta({
@@ -1468,13 +1637,9 @@ class EditSifuDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Edit SIFU")
         form = QFormLayout(self)
-        self.ed_name = QLineEdit(); self.ed_name.setText(str(meta.get("sifu_name", "SIFU")))
+        self.ed_name = QLineEdit()
         self.spin_sil = QSpinBox(); self.spin_sil.setRange(1, 4)
-        req_sil_str = str(meta.get("sil_required", "SIL 1"))
-        _, sil_rank_int = normalize_required_sil(req_sil_str)
-        self.spin_sil.setValue(int(sil_rank_int or 1))
         self.combo_mode = QComboBox(); self.combo_mode.addItems(["High demand", "Low demand"])
-        self.combo_mode.setCurrentText(str(meta.get("demand_mode_required", "High demand")))
         form.addRow("SIFU name", self.ed_name)
         form.addRow("Required SIL", self.spin_sil)
         form.addRow("Demand mode", self.combo_mode)
@@ -1482,6 +1647,17 @@ class EditSifuDialog(QDialog):
         btns.accepted.connect(self.accept)
         btns.rejected.connect(self.reject)
         form.addRow(btns)
+        self.set_meta(meta)
+
+    def set_meta(self, meta: RowMeta) -> None:
+        """Load the fields from a row's metadata (the dialog is reused across rows)."""
+        self.ed_name.setText(str(meta.get("sifu_name", "SIFU")))
+        req_sil_str = str(meta.get("sil_required", "SIL 1"))
+        _, sil_rank_int = normalize_required_sil(req_sil_str)
+        self.spin_sil.setValue(int(sil_rank_int or 1))
+        # A reused dialog still shows the previous row's mode; unknown values fall back to the first entry.
+        mode_idx = self.combo_mode.findText(str(meta.get("demand_mode_required", "High demand")))
+        self.combo_mode.setCurrentIndex(max(mode_idx, 0))
 
     def get_values(self) -> RowMeta:
         return RowMeta({
@@ -1546,6 +1722,17 @@ class AddComponentDialog(QDialog):
         self.combo_pfh_unit.currentTextChanged.connect(lambda _: _update_pfh_hint())
         _update_pfh_hint()
 
+    def reset(self, pref_kind: Optional[str] = None) -> None:
+        """Clear all inputs (the PFH hint follows via its signals), for reuse of the same instance."""
+        self.combo_kind.setCurrentText(pref_kind if pref_kind in ("sensor", "logic", "actuator") else "sensor")
+        self.ed_name.clear()
+        self.spin_pfd.setValue(0.0)
+        self.spin_pfh.setValue(0.0)
+        self.combo_pfh_unit.setCurrentIndex(0)
+        self.ed_syscap.clear()
+        self.ed_pdm.clear()
+        self.chk_insert.setChecked(False)
+
     def get_values(self) -> Dict[str, Any]:
         pfh_val = float(self.spin_pfh.value())
         pfh_unit = self.combo_pfh_unit.currentText()
@@ -1564,6 +1751,334 @@ class AddComponentDialog(QDialog):
             out["pfh_fit"] = float(pfh_val)
         return out
 
+# ==========================
+# HTML report assets (stylesheet + markup templates)
+# ==========================
+
+_REPORT_CSS = '''
+body { font: 14px/1.45 -apple-system, Segoe UI, Roboto, Helvetica, Arial, sans-serif; color: #111; margin: 0; background: #fff; }
+.page { padding: 24px 28px 40px; }
+h1 { font-size: 22px; margin: 0 0 8px; }
+h2 { font-size: 18px; margin: 24px 0 8px; border-bottom: 1px solid #e5e7eb; padding-bottom: 4px; }
+h3 { font-size: 16px; margin: 18px 0 6px; }
+.meta { color: #4b5563; font-size: 13px; margin-bottom: 12px; }
+table { border-collapse: collapse; width: 100%; margin: 8px 0 16px; font-size: 13px; }
+th, td { border: 1px solid #e5e7eb; padding: 6px 8px; text-align: left; vertical-align: top; }
+th { background: #f8fafc; font-weight: 600; }
+tbody tr:nth-child(even) { background:#f9fafb; }
+tbody tr:hover { background:#f1f5f9; }
+table.component-table { table-layout: fixed; }
+table.component-table col.col-code { width: 32%; }
+table.component-table col.col-pfd { width: 14%; }
+table.component-table col.col-pfh { width: 16%; }
+table.component-table col.col-fit { width: 14%; }
+table.component-table col.col-sil { width: 14%; }
+table.component-table col.col-pdm { width: 10%; }
+table.component-table tbody tr.group-row td { background:#eef2ff; font-weight:600; border-bottom:0; }
+table.component-table tbody tr.group-row:hover td { background:#e0e7ff; }
+table.component-table tbody tr.group-row td .group-label { display:flex; flex-wrap:wrap; align-items:center; gap:8px; }
+table.component-table tbody tr.group-row td .group-title { font-size:13px; }
+table.component-table tbody tr.group-member td { background:#f9f5ff; border-top:0; font-size:12px; }
+table.component-table tbody tr.group-member:hover td { background:#ede9fe; }
+table.component-table tbody tr.group-member td:first-child { padding-left:30px; position:relative; }
+table.component-table tbody tr.group-member td:first-child::before { content:'↳'; position:absolute; left:12px; top:50%; transform:translateY(-50%); color:#6366f1; font-size:12px; }
+table.component-table td.right, table.component-table th.right { font-variant-numeric: tabular-nums; white-space: nowrap; }
+.member-tag { display:inline-flex; align-items:center; padding:1px 6px; border-radius:999px; background:#ede9fe; color:#312e81; font-weight:600; }
+.member-caption { display:inline-flex; align-items:center; color:#6b7280; font-size:11px; margin-top:0; }
+.ok { color: #166534; font-weight: 600; }
+.bad { color: #b91c1c; font-weight: 600; }
+.pill { display:inline-flex; align-items:center; padding:2px 7px; border:1px solid #d1d5db; border-radius:999px; font-size:11px; font-weight:500; text-transform:uppercase; letter-spacing:0.04em; background:#f9fafb; color:#374151; }
+.pill.arch, .lane-pill.arch { background:#ede9fe; color:#312e81; border:1px solid #c4b5fd; }
+.grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(260px, 1fr)); gap: 12px; }
+.card { border:1px solid #e5e7eb; border-radius:10px; padding:10px 12px; background:#fff; }
+.muted { color:#6b7280; }
+.small { font-size: 12px; }
+.code { font-family: ui-monospace, SFMono-Regular, Menlo, Consolas, monospace; }
+.right { text-align:right; }
+.nowrap { white-space: nowrap; }
+.architecture { margin: 18px 0 24px; }
+.arch-lanes { display: grid; grid-template-columns: repeat(auto-fit, minmax(240px, 1fr)); gap: 16px; }
+.lane { border:1px solid #e5e7eb; border-radius:12px; padding:12px 14px; background:#fff; box-shadow:0 6px 18px rgba(15,23,42,0.04); display:flex; flex-direction:column; }
+.lane-header { font-size: 12px; letter-spacing: 0.08em; text-transform: uppercase; color:#1f2937; margin-bottom:10px; }
+.lane-cards { display:flex; flex-direction:column; gap:4px; }
+.lane-card { border:1px solid #e5e7eb; border-radius:10px; padding:8px 10px; background:#f9fafb; border-left:4px solid transparent; display:flex; flex-direction:column; gap:6px; }
+.lane-card.group { background:#f5f3ff; border-color:#c7d2fe; border-left-color:#6366f1; }
+.lane-card.empty { border-style: dashed; color:#9ca3af; background:#fff; border-left-color:transparent; }
+.lane--sensors .lane-card { border-left-color:#0EA5E9; }
+.lane--logic .lane-card { border-left-color:#22C55E; }
+.lane--actuators .lane-card { border-left-color:#A855F7; }
+.chip-link-dot { width:10px; height:10px; border-radius:999px; border:1px solid rgba(148,163,184,0.45); background:transparent; display:inline-flex; flex-shrink:0; }
+.lane-card-header { display:flex; align-items:center; justify-content:space-between; gap:8px; }
+.lane-title { display:flex; align-items:center; gap:6px; font-size:13px; font-weight:600; color:#111827; margin:0; }
+.lane-title-text { display:inline-flex; align-items:center; }
+.lane-subtitle { font-size:11px; color:#6b7280; margin:0; }
+.lane-metrics { display:flex; flex-wrap:wrap; gap:6px; font-size:11px; color:#374151; }
+.lane-metrics span { white-space:nowrap; padding:0 6px; border-radius:999px; background:#fff; border:1px solid #e5e7eb; }
+.lane-pill { display:inline-flex; align-items:center; padding:2px 6px; border-radius:999px; background:#e5e7eb; color:#374151; font-size:10px; letter-spacing:0.05em; text-transform:uppercase; }
+.lane-members { display:grid; grid-template-columns:repeat(auto-fit, minmax(150px, 1fr)); gap:4px; }
+.lane-member { border:1px solid #d1d5db; border-radius:8px; padding:4px 6px; background:#fff; border-left:3px solid transparent; display:flex; flex-direction:column; gap:4px; }
+.lane--sensors .lane-member { border-left-color:#0EA5E9; }
+.lane--logic .lane-member { border-left-color:#22C55E; }
+.lane--actuators .lane-member { border-left-color:#A855F7; }
+.lane-member-title { display:flex; align-items:center; gap:6px; font-size:11px; color:#1f2937; font-weight:600; margin:0; }
+.lane-member-text { color:#1f2937; }
+.lane-member .lane-metrics { margin:0; gap:4px; font-size:10px; }
+.lane-member .lane-metrics span { background:#f8fafc; border:1px solid #e2e8f0; padding:0 5px; }
+.lane-group-meta { font-size:11px; color:#4b5563; }
+.lane-note { font-size:11px; color:#6b7280; margin-top:4px; }
+.component-label { display:flex; align-items:center; gap:6px; flex-wrap:wrap; }
+.component-label-text { font-weight:600; color:#1f2937; }
+.link-subgroup-box { margin-top:16px; border:1px solid #e5e7eb; border-radius:12px; padding:12px 14px; background:#fff; box-shadow:0 6px 18px rgba(15,23,42,0.04); }
+.link-subgroup-heading { font-size:12px; letter-spacing:0.08em; text-transform:uppercase; color:#1f2937; margin:0 0 10px; }
+.link-subgroup-list { display:flex; flex-direction:column; gap:10px; }
+.link-subgroup-card { border:1px solid #e5e7eb; border-radius:10px; padding:10px 12px; background:#f9fafb; }
+.link-subgroup-header { display:flex; align-items:center; justify-content:space-between; gap:8px; }
+.link-subgroup-title { display:flex; align-items:center; gap:6px; font-size:13px; font-weight:600; }
+.pill.subgroup { background:#dbeafe; color:#1d4ed8; border:1px solid #bfdbfe; }
+.link-subgroup-color { width:14px; height:14px; border-radius:999px; border:1px solid rgba(17,24,39,0.18); }
+.link-subgroup-lanes { font-size:12px; color:#4b5563; }
+.link-subgroup-metrics { margin-top:6px; font-size:12px; color:#1f2937; font-variant-numeric:tabular-nums; }
+.link-subgroup-members { margin-top:8px; display:flex; flex-wrap:wrap; gap:6px; }
+.link-subgroup-member { display:inline-flex; align-items:center; gap:6px; padding:4px 8px; border-radius:999px; background:#ede9fe; color:#312e81; font-size:12px; }
+.link-subgroup-member .lane { color:#4338ca; font-size:11px; }
+.formula-section { margin: 24px 0; }
+.formula-layout { display:flex; flex-wrap:wrap; gap:20px; align-items:stretch; }
+.formula-column { display:flex; flex-direction:column; gap:16px; }
+.formula-column--architecture { flex:1 1 340px; }
+.formula-column--supporting { flex:1 1 260px; }
+.formula-column--variables { flex:1 1 320px; min-width:280px; }
+.formula-panel { flex:0 0 auto; border:1px solid #e5e7eb; border-radius:10px; background:#fff; box-shadow:0 6px 16px rgba(15,23,42,0.05); display:flex; flex-direction:column; min-width:240px; }
+.formula-panel-header { padding:12px 16px; background:#f8fafc; color:#111827; font-weight:600; font-size:14px; border-bottom:1px solid #e5e7eb; }
+.formula-panel-body { padding:12px 16px 16px; display:flex; flex-direction:column; gap:14px; }
+.formula-box { border:1px solid #e5e7eb; border-radius:8px; background:#f9fafb; padding:12px 14px; }
+.formula-note { margin:6px 0 0; }
+.formula-table { width:100%; border-collapse:collapse; font-size:13px; }
+.formula-table th, .formula-table td { border:1px solid #e5e7eb; padding:6px 8px; text-align:left; }
+.formula-table th { background:#f8fafc; width:32%; }
+@media (max-width: 960px) {
+    .formula-layout { flex-direction:column; }
+    .formula-column--variables { min-width:0; }
+}
+@media (max-width: 720px) {
+    .formula-panel { min-width:0; }
+}
+@media print { .page { padding: 0; } .no-print { display:none; } }
+'''
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};:,])\s*', r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+# Minified once at import; embedded into every exported report.
+_REPORT_CSS_MIN = _minify_css(_REPORT_CSS)
+
+# Lane titles keyed by component group, and the architecture stages in display order.
+_LANE_TITLES: Dict[str, str] = {
+    'sensor': 'Sensors / Inputs',
+    'logic': 'Logic',
+    'actuator': 'Outputs / Actuators',
+}
+# Link subgroups track the lanes they span as a bitmask; bits follow the sorted lane keys
+# so _LANE_MASK_TITLES[mask] lists the titles in the same order as before.
+_LANE_BITS: Dict[str, int] = {lane: 1 << i for i, lane in enumerate(sorted(_LANE_TITLES))}
+_LANE_MASK_TITLES: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(_LANE_TITLES[lane] for lane, bit in _LANE_BITS.items() if mask & bit)
+    for mask in range(1 << len(_LANE_BITS))
+)
+_STAGE_KEYS: Tuple[str, ...] = ('sensors', 'logic', 'actuators')
+_STAGE_TITLES: Dict[str, str] = {
+    'sensors': _LANE_TITLES['sensor'],
+    'logic': _LANE_TITLES['logic'],
+    'actuators': _LANE_TITLES['actuator'],
+}
+
+# Architecture-lane markup, formatted per card instead of assembled tag by tag.
+_LANE_OPEN_TPL = '<div class="lane lane--{key}"><div class="lane-header">{title}</div><div class="lane-cards">'
+_LANE_CLOSE = '</div></div>'
+_LANE_TITLE_TPL = '<div class="lane-title">{dot}<span class="lane-title-text">{label}</span></div>'
+_LANE_MEMBER_TITLE_TPL = (
+    '<div class="lane-member">'
+    '<div class="lane-member-title">{dot}<span class="lane-member-text">{label}</span></div>'
+)
+_LINK_DOT_TPL = '<span class="chip-link-dot" style="background:{color};"></span>'
+# Lane titles are fixed, so their escaped markup is rendered once here.
+_LANE_OPEN_HTML: Dict[str, str] = {
+    key: _LANE_OPEN_TPL.format(key=key, title=html.escape(title))
+    for key, title in _STAGE_TITLES.items()
+}
+_LANE_CAPTION_HTML: Dict[str, str] = {
+    title: f'<span class="lane">{html.escape(title)}</span>'
+    for title in _LANE_TITLES.values()
+}
+_SUBGROUP_MEMBER_TMPL = (
+    '<div class="link-subgroup-member"{tooltip}>{dot}<span class="member-tag">{label}</span>{lane}</div>'
+)
+_SUBGROUP_BOX_OPEN = (
+    '<div class="link-subgroup-box"><div class="link-subgroup-heading">Link subgroups</div>'
+    '<div class="link-subgroup-list">'
+)
+
+# Invariant report fragments. The report is joined with newlines, so the multi-line
+# head/footer blocks are pre-joined the same way.
+_REPORT_HEAD = '\n'.join((
+    '<!doctype html><html><head><meta charset="utf-8">',
+    '<meta name="viewport" content="width=device-width,initial-scale=1">',
+    '<title>SIFU Report</title>',
+    f'<style>{_REPORT_CSS_MIN}</style>',
+    '<script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>',
+    '<script id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>',
+    '</head><body>',
+    '<div class="page">',
+    '<h1>SIFU Calculation Report</h1>',
+))
+_REPORT_FOOTER = '\n'.join((
+    '<div class="muted small">This report is generated for documentation support of IEC 61508 evaluations. '
+    'Ensure project-specific assumptions and operational profiles are validated.</div>',
+    '</div>',
+    '</body></html>',
+))
+_SUMMARY_TABLE_OPEN = '\n'.join((
+    '<h2>Summary</h2>',
+    '<table><thead><tr><th>#</th><th>SIFU</th><th>Demand mode (effective)</th><th>Required SIL</th>'
+    '<th>Calculated SIL</th><th class="right">PFDsum</th><th class="right">PFHsum [1/h]</th>'
+    '<th>Status</th></tr></thead><tbody>',
+))
+_COMPONENT_TABLE_OPEN = (
+    '<table class="component-table"><colgroup><col class="col-code"><col class="col-pfd">'
+    '<col class="col-pfh"><col class="col-fit"><col class="col-sil"><col class="col-pdm"></colgroup>'
+    '<thead><tr><th>Code / Name</th><th class="right">PFDavg</th><th class="right">PFHavg [1/h]</th>'
+    '<th class="right">PFH [FIT]</th><th>SIL capability</th><th>PDM code</th></tr></thead><tbody>'
+)
+_COMPONENT_ROW_TMPL = (
+    '<tr{row_class}><td>{label}</td><td class="right">{pfd}</td><td class="right">{pfh}</td>'
+    '<td class="right">{fit}</td><td>{sil}</td><td>{pdm}</td></tr>'
+)
+# First-column labels of the component tables; {dot} is a _LINK_DOT_TPL or ''.
+_GROUP_LABEL_TMPL = (
+    '<div class="group-label"><span class="pill arch">1oo2</span>{dot}'
+    '<span class="group-title">{title}</span></div>'
+)
+_COMPONENT_LABEL_TMPL = (
+    '<div class="component-label">{dot}<span class="component-label-text">{label}</span></div>{note}'
+)
+_MEMBER_LABEL_TMPL = (
+    '<div class="component-label">{dot}<span class="member-tag">{label}</span>{caption}</div>{note}'
+)
+_MEMBER_CAPTION_TMPL = '<span class="member-caption">{caption}</span>'
+_LANE_NOTE_TMPL = '<div class="lane-note">{note}</div>'
+# Fixed-arity row: (index, name, mode, required SIL, calculated SIL, PFD, PFH, status badge).
+_SUMMARY_ROW_TMPL = (
+    '<tr><td class="nowrap">%s</td><td>%s</td><td>%s</td><td>%s</td><td>%s</td>'
+    '<td class="right">%s</td><td class="right">%s</td><td>%s</td></tr>'
+)
+# Number formats of the report tables (PFDavg, PFHavg in 1/h, PFH in FIT).
+_FMT_PFD = '{:.6f}'.format
+_FMT_PFH = '{:.3e}'.format
+_FMT_FIT = '{:.2f}'.format
+_STATUS_BADGE: Dict[bool, str] = {
+    True: '<span class="ok">meets</span>',
+    False: '<span class="bad">fails</span>',
+}
+
+
+@lru_cache(maxsize=None)
+def _formula_reference_html() -> str:
+    """Static "Base Formulas" section; identical for every report, rendered once per process."""
+    esc = escape_html
+    section_parts: List[str] = []
+    section_parts.append('<section class="formula-section">')
+    section_parts.append('<h2>Base Formulas</h2>')
+
+    def render_formulas(entries: List[Tuple[str, str]]) -> str:
+        box_bits: List[str] = []
+        for latex, note in entries:
+            box_bits.append('<div class="formula-box">')
+            box_bits.append(f'\\[{latex}\\]')
+            box_bits.append(f'<p class="formula-note muted small"><em>{esc(note)}</em></p>')
+            box_bits.append('</div>')
+        return ''.join(box_bits)
+
+    def panel_block(title: str, inner_html: str) -> str:
+        block_parts: List[str] = []
+        block_parts.append('<div class="formula-panel">')
+        block_parts.append(f'<div class="formula-panel-header">{esc(title)}</div>')
+        block_parts.append('<div class="formula-panel-body">')
+        block_parts.append(inner_html)
+        block_parts.append('</div>')
+        block_parts.append('</div>')
+        return ''.join(block_parts)
+
+    oneoo1_entries = [
+        (r'PFD_{1oo1} = \lambda_{DU}(T_I/2 + MTTR) + \lambda_{DD}MTTR', 'Average probability of failure on demand for a single 1oo1 channel.'),
+        (r'PFH_{1oo1} = \lambda_{DU}', 'Dangerous failure rate per hour for a single 1oo1 channel.'),
+    ]
+    architecture_blocks = [
+        panel_block('1oo1 Architecture', render_formulas(oneoo1_entries)),
+    ]
+    oneoo2_entries = [
+        (r't_{CE} = \frac{\lambda_{DU}^{ind}}{\lambda_D^{ind}}(T_I/2 + MTTR) + \frac{\lambda_{DD}^{ind}}{\lambda_D^{ind}}MTTR', 'Exposure time for common-cause dangerous undetected combinations using independent channel rates.'),
+        (r't_{GE} = \frac{\lambda_{DU}^{ind}}{\lambda_D^{ind}}(T_I/3 + MTTR) + \frac{\lambda_{DD}^{ind}}{\lambda_D^{ind}}MTTR', 'Exposure time for general dangerous undetected combinations with staggered testing, independent portion.'),
+        (r'PFD_{1oo2} = 2(1-\beta)^2(\lambda_D)^2 t_{CE}t_{GE} \\[4pt]'
+         r'+ \beta\lambda_{DU}(T_I/2 + MTTR) + \beta_D\lambda_{DD}MTTR', 'System-level probability of failure on demand for a redundant 1oo2 channel.'),
+        (r'PFH_{1oo2} = 2(1-\beta)\lambda_D^{ind}\lambda_{DU}^{ind}t_{CE} + \beta\lambda_{DU}', 'System-level dangerous failure rate per hour for a redundant 1oo2 channel.'),
+    ]
+    architecture_blocks.append(
+        panel_block('1oo2 Architecture', render_formulas(oneoo2_entries))
+    )
+
+    supporting_entries = [
+        (r'\lambda_D = \lambda_{DU} + \lambda_{DD}', 'Total dangerous failure rate split into undetected and detected parts.'),
+        (r'\lambda_{DU} = r_{DU}\lambda_D,\ \lambda_{DD} = r_{DD}\lambda_D', 'Ratios mapping total dangerous failures to undetected and detected portions.'),
+        (r'\lambda_{DU}^{ind} = (1-\beta)\lambda_{DU},\ \lambda_{DD}^{ind} = (1-\beta_D)\lambda_{DD}', 'Independent channel failure rates after removing common cause factors.'),
+    ]
+    supporting_block = panel_block('Supporting Relations', render_formulas(supporting_entries))
+
+    var_rows: List[Tuple[str, str]] = [
+        (r't_{CE}', 'Exposure window for common-cause dangerous undetected failures.'),
+        (r't_{GE}', 'Exposure window for general dangerous undetected failures.'),
+        (r'\lambda_{DU}', 'Dangerous undetected failure rate.'),
+        (r'\lambda_{DD}', 'Dangerous detected failure rate.'),
+        (r'\lambda_D', 'Total dangerous failure rate (detected + undetected).'),
+        (r'\lambda_D^{ind}', 'Independent-channel total dangerous failure rate (excludes common cause).'),
+        (r'\lambda_{DU}^{ind}', 'Channel-specific dangerous undetected failure rate (independent portion).'),
+        (r'\lambda_{DD}^{ind}', 'Channel-specific dangerous detected failure rate (independent portion).'),
+        (r'r_{DU}', 'Fraction of dangerous failures that are undetected.'),
+        (r'r_{DD}', 'Fraction of dangerous failures that are detected.'),
+        (r'\beta', 'Common cause factor for dangerous undetected failures.'),
+        (r'\beta_D', 'Common cause factor for dangerous detected failures.'),
+        (r'T_I', 'Proof-test interval.'),
+        (r'MTTR', 'Mean time to repair.'),
+    ]
+    table_parts: List[str] = ['<div class="formula-box">', '<table class="formula-table"><thead><tr><th>Symbol</th><th>Meaning</th></tr></thead><tbody>']
+    for symbol, meaning in var_rows:
+        table_parts.append('<tr>')
+        table_parts.append(f'<td class="nowrap">\\({symbol}\\)</td>')
+        table_parts.append(f'<td>{esc(meaning)}</td>')
+        table_parts.append('</tr>')
+    table_parts.append('</tbody></table></div>')
+    variable_block = panel_block('Variable Summary', ''.join(table_parts))
+
+    section_parts.append('<div class="formula-layout">')
+    section_parts.append('<div class="formula-column formula-column--architecture">')
+    section_parts.extend(architecture_blocks)
+    section_parts.append('</div>')
+    section_parts.append('<div class="formula-column formula-column--supporting">')
+    section_parts.append(supporting_block)
+    section_parts.append('</div>')
+    section_parts.append('<div class="formula-column formula-column--variables">')
+    section_parts.append(variable_block)
+    section_parts.append('</div>')
+    section_parts.append('</div>')
+
+    section_parts.append('</section>')
+    return ''.join(section_parts)
+
+
 # ==========================
 # Main Window
 # ==========================
@@ -1571,6 +2086,8 @@ class AddComponentDialog(QDialog):
 class MainWindow(QMainWindow):
     def __init__(self, df):
         super().__init__()
+        # Standard icons of this window's style by QStyle.StandardPixmap, see _std_icon
+        self._icon_cache: Dict[int, QIcon] = {}
         self.setWindowTitle("SIL Calculator")
         self.resize(1400, 840)
         self.df = df
@@ -1583,6 +2100,9 @@ class MainWindow(QMainWindow):
             'beta_D': 0.02,# [–]
         }
         self.du_dd_ratios = {'sensor': (0.7, 0.3), 'logic': (0.6, 0.4), 'actuator': (0.6, 0.4)}
+        # Snapshots derived from the two dicts above; reset via _invalidate_config_cache().
+        self._assumptions_cache: Optional[Assumptions] = None
+        self._ratios_cache: Dict[str, Tuple[float, float]] = {}
 
         self.link_palette: List[Tuple[str, str]] = [
             ("#FDE68A", "link0"),
@@ -1652,7 +2172,7 @@ class MainWindow(QMainWindow):
         act_new = QAction("New Project", self)
         act_new.setShortcut("Ctrl+Shift+N")
         act_new.setToolTip("Clear current assignment (keep libraries) (Ctrl+Shift+N)")
-        act_new.setIcon(self.style().standardIcon(QStyle.SP_FileIcon))
+        act_new.setIcon(self._std_icon(QStyle.SP_FileIcon))
         act_new.triggered.connect(lambda: (getattr(self, "_action_new_project", None) or self._new_project_impl)())
         #tb.addAction(act_new)
 
@@ -1660,7 +2180,7 @@ class MainWindow(QMainWindow):
         act_add_sifu = QAction("Add SIFU", self)
         act_add_sifu.setShortcut("Ctrl+N")
         act_add_sifu.setToolTip("Add a new SIFU row (Ctrl+N)")
-        act_add_sifu.setIcon(self.style().standardIcon(QStyle.SP_FileDialogNewFolder))
+        act_add_sifu.setIcon(self._std_icon(QStyle.SP_FileDialogNewFolder))
         act_add_sifu.triggered.connect(self._action_add_sifu)
         #tb.addAction(act_add_sifu)
 
@@ -1668,7 +2188,7 @@ class MainWindow(QMainWindow):
         act_remove_sifu = QAction("Remove SIFU", self)
         act_remove_sifu.setShortcut("Ctrl+Del")
         act_remove_sifu.setToolTip("Remove selected SIFU (Ctrl+Del)")
-        act_remove_sifu.setIcon(self.style().standardIcon(QStyle.SP_TrashIcon))
+        act_remove_sifu.setIcon(self._std_icon(QStyle.SP_TrashIcon))
         act_remove_sifu.triggered.connect(self._action_remove_sifu)
         #tb.addAction(act_remove_sifu)
 
@@ -1676,14 +2196,14 @@ class MainWindow(QMainWindow):
         act_edit_sifu = QAction("Edit SIFU", self)
         act_edit_sifu.setShortcut("Ctrl+E")
         act_edit_sifu.setToolTip("Edit SIFU parameters (Ctrl+E)")
-        act_edit_sifu.setIcon(self.style().standardIcon(QStyle.SP_FileDialogListView))
+        act_edit_sifu.setIcon(self._std_icon(QStyle.SP_FileDialogListView))
         act_edit_sifu.triggered.connect(self._action_edit_sifu)
        #tb.addAction(act_edit_sifu)
         # Duplicate SIFU
         act_duplicate_sifu = QAction("Duplicate SIFU", self)
         act_duplicate_sifu.setShortcut("Ctrl+D")
         act_duplicate_sifu.setToolTip("Duplicate the selected SIFU (Ctrl+D)")
-        act_duplicate_sifu.setIcon(self.style().standardIcon(QStyle.SP_FileDialogNewFolder))
+        act_duplicate_sifu.setIcon(self._std_icon(QStyle.SP_FileDialogNewFolder))
         act_duplicate_sifu.triggered.connect(self._action_duplicate_sifu)
         #tb.addAction(act_duplicate_sifu)
 
@@ -1696,7 +2216,7 @@ class MainWindow(QMainWindow):
         act_add_comp = QAction("Add Component…", self)
         act_add_comp.setShortcut("Ctrl+Alt+N")
         act_add_comp.setToolTip("Add component to a library; optionally insert into current row (Ctrl+Alt+N)")
-        act_add_comp.setIcon(self.style().standardIcon(QStyle.SP_FileDialogContentsView))
+        act_add_comp.setIcon(self._std_icon(QStyle.SP_FileDialogContentsView))
         act_add_comp.triggered.connect(self.open_add_component_dialog)
         #tb.addAction(act_add_comp)
 
@@ -1704,14 +2224,14 @@ class MainWindow(QMainWindow):
 
         # Save / Load
         act_save_yaml = QAction("Save", self)
-        act_save_yaml.setIcon(self.style().standardIcon(QStyle.SP_DialogSaveButton))
+        act_save_yaml.setIcon(self._std_icon(QStyle.SP_DialogSaveButton))
         act_save_yaml.setShortcut("Ctrl+S")
         act_save_yaml.setToolTip("Save current assignment as YAML (Ctrl+S)")
         act_save_yaml.triggered.connect(self._action_export_yaml)
         #tb.addAction(act_save_yaml)
 
         act_load_yaml = QAction("Load", self)
-        act_load_yaml.setIcon(self.style().standardIcon(QStyle.SP_DialogOpenButton))
+        act_load_yaml.setIcon(self._std_icon(QStyle.SP_DialogOpenButton))
         act_load_yaml.setShortcut("Ctrl+O")
         act_load_yaml.setToolTip("Load assignment from YAML (Ctrl+O)")
         act_load_yaml.triggered.connect(self._action_import_yaml)
@@ -1721,12 +2241,12 @@ class MainWindow(QMainWindow):
         act_config = QAction("Configuration", self)
         act_config.setToolTip("Edit global parameters (Ctrl+,)")
         act_config.setShortcut("Ctrl+,")
-        act_config.setIcon(self.style().standardIcon(QStyle.SP_FileDialogDetailedView))
+        act_config.setIcon(self._std_icon(QStyle.SP_FileDialogDetailedView))
         act_config.triggered.connect(self._open_config_dialog)
         #tb.addAction(act_config)
         # Export HTML report
         act_export_html = QAction("Export Report (HTML)", self)
-        act_export_html.setIcon(self.style().standardIcon(QStyle.SP_ArrowRight))
+        act_export_html.setIcon(self._std_icon(QStyle.SP_ArrowRight))
         act_export_html.setShortcut("Ctrl+Shift+E")
         act_export_html.setToolTip("Export an HTML report for all SIFUs (Ctrl+Shift+E)")
         act_export_html.triggered.connect(self._action_export_html_report)
@@ -1789,6 +2309,17 @@ class MainWindow(QMainWindow):
         self._filter_timer.setSingleShot(True)
         self._filter_timer.setInterval(120)
         self._filter_timer.timeout.connect(self._reapply_sifu_filter)
+        # Casefolded filter text per row uid; dropped whenever the row is recalculated.
+        self._row_haystack_cache: Dict[str, str] = {}
+        # (tokens, row count) of the last applied filter; None forces the next pass.
+        self._last_filter_state: Optional[Tuple[Tuple[str, ...], int]] = None
+        # Dialogs built on first use and reused afterwards
+        self._add_sifu_dlg: Optional[AddSifuDialog] = None
+        self._edit_sifu_dlg: Optional[EditSifuDialog] = None
+        self._add_comp_dlg: Optional[AddComponentDialog] = None
+        # Coalesced recalculation, see _schedule_recalculate
+        self._recalc_pending = False
+        self._reseed_pending = False
         self.sifu_filter.textChanged.connect(self._schedule_filter_update)
         self.sifu_filter.returnPressed.connect(self._reapply_sifu_filter)
 
@@ -1832,7 +2363,8 @@ class MainWindow(QMainWindow):
         act_loaded    = self.act_lib.load_from_yaml()
 
         # Build initial rows from DataFrame
-        self.sifu_widgets: Dict[int, SifuRowWidgets] = {}
+        # Keyed by row uid (RowMeta['_uid']) so removing a row does not shift the other entries.
+        self.sifu_widgets: Dict[str, SifuRowWidgets] = {}
         self._populate_from_dataframe()
 
         # If YAML files are missing, bootstrap (existing code)
@@ -2172,16 +2704,13 @@ class MainWindow(QMainWindow):
             self.rows_meta.append(meta)
             self._ensure_row_uid(meta)
 
-            header = f"{meta['sifu_name']} \nRequired {meta['sil_required']} \n{meta['demand_mode_ required'] if 'demand_mode_ required' in meta else meta['demand_mode_required']}"
-            # Fix whitespace key if any
-            header = header.replace("demand_mode_ required", "demand_mode_required")
-            self.table.setVerticalHeaderItem(row_idx, QTableWidgetItem(header))
+            self._set_row_header(row_idx)
 
             widgets = SifuRowWidgets()
-            self.sifu_widgets[row_idx] = widgets
+            self.sifu_widgets[meta['_uid']] = widgets
 
             widgets.result.combo.setCurrentText(meta['demand_mode_required'])
-            widgets.result.override_changed.connect(lambda val, r=row_idx: self._on_row_override_changed(r, val))
+            widgets.result.override_changed.connect(lambda val, uid=meta['_uid']: self._on_row_override_changed(self._row_index_from_uid(uid), val))
 
             self.table.setCellWidget(row_idx, 0, widgets.in_list)
             self.table.setCellWidget(row_idx, 1, widgets.logic_list)
@@ -2231,7 +2760,7 @@ class MainWindow(QMainWindow):
 
     def _refresh_group_tooltips_in_row(self, row_idx: int) -> None:
         """Update tooltips for all 1oo2 groups in Output/Actuator of the given row."""
-        widgets = self.sifu_widgets.get(row_idx)
+        widgets = self._widgets_for_row(row_idx)
         if not widgets: return
         mode = self._effective_demand_mode(row_idx) if 0 <= row_idx < len(self.rows_meta) else ""
         mode_key = "low_demand" if "low" in str(mode).lower() else "high_demand"
@@ -2250,8 +2779,9 @@ class MainWindow(QMainWindow):
         seen = set()
         gathered: List[Dict[str, Any]] = []
         for row_idx in range(self.table.rowCount()):
-            lw = self.sifu_widgets[row_idx].in_list if kind == "sensor" else (
-                self.sifu_widgets[row_idx].logic_list if kind == "logic" else self.sifu_widgets[row_idx].out_list
+            widgets = self._widgets_for_row(row_idx)
+            lw = widgets.in_list if kind == "sensor" else (
+                widgets.logic_list if kind == "logic" else widgets.out_list
             )
             for i in range(lw.count()):
                 d = lw.item(i).data(Qt.UserRole) or {}
@@ -2294,6 +2824,9 @@ class MainWindow(QMainWindow):
         # Extra Felder in die UserRole-Daten übernehmen:
         if isinstance(extra_fields, dict):
             data.update({k: v for k, v in extra_fields.items() if k not in data})
+            # Group members are only type-checked here; the recompute path uses them as is.
+            if isinstance(data.get("members"), list):
+                data["members"] = [m for m in data["members"] if isinstance(m, dict)]
         if pfh_fit is not None:
             data["pfh_fit"] = float(pfh_fit)
         if pfd_fit is not None:
@@ -2303,6 +2836,17 @@ class MainWindow(QMainWindow):
         if not isinstance(inst_id, str) or not inst_id:
             inst_id = new_instance_id()
         data["instance_id"] = inst_id
+        # Canonical link fields up front, so recalculation passes find nothing to rewrite.
+        color = self._sanitize_link_color(data.get("link_color"))
+        if color:
+            data["link_color"] = color
+        else:
+            data.pop("link_color", None)
+        group_id = self._normalize_link_group_id(data.get("link_group_id"))
+        if group_id and color:
+            data["link_group_id"] = group_id
+        else:
+            data.pop("link_group_id", None)
 
         item.setData(Qt.UserRole, data)
         item.setSizeHint(QtCore.QSize(170, 38))
@@ -2315,15 +2859,15 @@ class MainWindow(QMainWindow):
         if not comps: return
         to_add = comps[: max(0, count)]
         for row_idx in range(self.table.rowCount()):
-            widgets = self.sifu_widgets.get(row_idx)
+            widgets = self._widgets_for_row(row_idx)
             if not widgets: continue
             if widgets.logic_list.count() > 0:
                 continue
             for comp in to_add:
-                name = str(comp.get('name', comp.get('code', 'Logic')))
-                pfd = float(comp.get('pfd_avg', comp.get('pfd', 0.0)))
-                pfh = float(comp.get('pfh_avg', comp.get('pfh', 0.0)))
-                syscap = comp.get('sys_cap', comp.get('syscap', ''))
+                name = str(_pick(comp, 'name', 'code', 'Logic'))
+                pfd = float(_pick(comp, 'pfd_avg', 'pfd', 0.0))
+                pfh = float(_pick(comp, 'pfh_avg', 'pfh', 0.0))
+                syscap = _pick(comp, 'sys_cap', 'syscap', '')
                 item = self._make_item(name, pfd, pfh, syscap, kind="logic")
                 widgets.logic_list.addItem(item)
                 widgets.logic_list.attach_chip(item)
@@ -2343,11 +2887,11 @@ class MainWindow(QMainWindow):
 
     def _add_logic_to_current_row(self, data: dict):
         row = self._current_row_index()
-        widgets = self.sifu_widgets.get(row); assert widgets
+        widgets = self._widgets_for_row(row); assert widgets
         name = data.get("name") or data.get("code") or "Logic"
-        pfd = float(data.get("pfd", data.get("pfd_avg", 0.0)))
-        pfh = float(data.get("pfh", data.get("pfh_avg", 0.0)))
-        syscap = data.get("syscap", data.get("sys_cap", ""))
+        pfd = float(_pick(data, "pfd", "pfd_avg", 0.0))
+        pfh = float(_pick(data, "pfh", "pfh_avg", 0.0))
+        syscap = _pick(data, "syscap", "sys_cap", "")
         pdm = data.get("pdm_code", "")
         pfh_fit = data.get("pfh_fit", None); pfd_fit = data.get("pfd_fit", None)
 
@@ -2363,11 +2907,11 @@ class MainWindow(QMainWindow):
 
     def _add_sensor_to_current_row(self, data: dict):
         row = self._current_row_index()
-        widgets = self.sifu_widgets.get(row); assert widgets
+        widgets = self._widgets_for_row(row); assert widgets
         name = data.get("name") or data.get("code") or "Sensor"
-        pfd = float(data.get("pfd", data.get("pfd_avg", 0.0)))
-        pfh = float(data.get("pfh", data.get("pfh_avg", 0.0)))
-        syscap = data.get("syscap", data.get("sys_cap", ""))
+        pfd = float(_pick(data, "pfd", "pfd_avg", 0.0))
+        pfh = float(_pick(data, "pfh", "pfh_avg", 0.0))
+        syscap = _pick(data, "syscap", "sys_cap", "")
         pdm = data.get("pdm_code", "")
         pfh_fit = data.get("pfh_fit", None); pfd_fit = data.get("pfd_fit", None)
         item = self._make_item(str(name), pfd, pfh, syscap, pdm, kind="sensor", pfh_fit=pfh_fit, pfd_fit=pfd_fit)
@@ -2378,11 +2922,11 @@ class MainWindow(QMainWindow):
 
     def _add_actuator_to_current_row(self, data: dict):
         row = self._current_row_index()
-        widgets = self.sifu_widgets.get(row); assert widgets
+        widgets = self._widgets_for_row(row); assert widgets
         name = data.get("name") or data.get("code") or "Actuator"
-        pfd = float(data.get("pfd", data.get("pfd_avg", 0.0)))
-        pfh = float(data.get("pfh", data.get("pfh_avg", 0.0)))
-        syscap = data.get("syscap", data.get("sys_cap", ""))
+        pfd = float(_pick(data, "pfd", "pfd_avg", 0.0))
+        pfh = float(_pick(data, "pfh", "pfh_avg", 0.0))
+        syscap = _pick(data, "syscap", "sys_cap", "")
         pdm = data.get("pdm_code", "")
         pfh_fit = data.get("pfh_fit", None); pfd_fit = data.get("pfd_fit", None)
         item = self._make_item(str(name), pfd, pfh, syscap, pdm, kind="actuator", pfh_fit=pfh_fit, pfd_fit=pfd_fit)
@@ -2398,6 +2942,7 @@ class MainWindow(QMainWindow):
             vals, ratios = dlg.get_values()
             self.assumptions.update(vals)
             self.du_dd_ratios.update(ratios)
+            self._invalidate_config_cache()
             self.statusBar().showMessage("Updated configuration", 1500)
             self.recalculate_all()
 
@@ -2419,7 +2964,7 @@ class MainWindow(QMainWindow):
         if not path: return
         try:
             with open(path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_SafeLoader) or {}
             self._rebuild_from_payload(data)
             QMessageBox.information(self, "Import", f"Imported from {path}.")
             self.statusBar().showMessage(f"Imported {os.path.basename(path)}", 2000)
@@ -2435,7 +2980,7 @@ class MainWindow(QMainWindow):
 
         # --- Quelle: Metadaten + Widgets ermitteln
         src_meta = self.rows_meta[row]
-        src_widgets = self.sifu_widgets.get(row)
+        src_widgets = self._widgets_for_row(row)
         if not src_widgets:
             QMessageBox.warning(self, "Duplicate SIFU", "Source row widgets not found.")
             return
@@ -2444,9 +2989,10 @@ class MainWindow(QMainWindow):
         new_meta = RowMeta(src_meta.copy())
         new_meta["sifu_name"] = f"{new_meta.get('sifu_name','SIFU')} (copy)"
         new_meta.pop("_uid", None)
+        new_meta.pop("_cached_header", None)
         self._append_sifu_row(new_meta)
         new_row = self.table.rowCount() - 1
-        dst_widgets = self.sifu_widgets.get(new_row)
+        dst_widgets = self._widgets_for_row(new_row)
 
         # --- Inhalte der drei Spalten kopieren
         def _clone_list(src_list, dst_list, group_kind: str):
@@ -2482,9 +3028,20 @@ class MainWindow(QMainWindow):
         if not path:
             return
         try:
-            html_doc = self._build_html_report()
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(html_doc)
+            # Render into a temp file next to the target and swap it in only when complete,
+            # so a failing export never leaves a truncated report behind.
+            fd, tmp_path = tempfile.mkstemp(prefix='.sifu_report-', suffix='.html',
+                                            dir=os.path.dirname(os.path.abspath(path)))
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    self._write_html_report(f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
             QMessageBox.information(self, "Export", f"HTML report written to {path}.")
             self.statusBar().showMessage(f"Exported HTML report to {os.path.basename(path)}", 3000)
         except Exception as e:
@@ -2504,7 +3061,7 @@ class MainWindow(QMainWindow):
         return -1
 
     def _clone_chip_data(self, data: dict, preserve_id: bool = False) -> dict:
-        new_data = copy.deepcopy(data) if data else {}
+        new_data = clone_payload(data) if data else {}
         if not preserve_id or not isinstance(new_data.get("instance_id"), str):
             new_data["instance_id"] = new_instance_id()
         if new_data.get("group") and isinstance(new_data.get("members"), list):
@@ -2512,7 +3069,7 @@ class MainWindow(QMainWindow):
             for member in new_data.get("members", []):
                 if not isinstance(member, dict):
                     continue
-                member_copy = copy.deepcopy(member)
+                member_copy = clone_payload(member)
                 if not preserve_id or not isinstance(member_copy.get("instance_id"), str):
                     member_copy["instance_id"] = new_instance_id()
                 members.append(member_copy)
@@ -2527,17 +3084,43 @@ class MainWindow(QMainWindow):
             return None
         return self._link_color_tags.get(str(color).lower())
 
+    def _std_icon(self, role: int) -> QIcon:
+        icon = self._icon_cache.get(role)
+        if icon is None:
+            icon = self._icon_cache[role] = self.style().standardIcon(role)
+        return icon
+
+    def changeEvent(self, event):
+        # Icons from the previous style must not be handed out after a style switch
+        if event.type() == QtCore.QEvent.StyleChange:
+            self._icon_cache.clear()
+        super().changeEvent(event)
+
     def _row_uid_for_index(self, row_idx: int) -> Optional[str]:
         if 0 <= row_idx < len(self.rows_meta):
             return self._ensure_row_uid(self.rows_meta[row_idx])
         return None
 
+    def _set_row_header(self, row_idx: int) -> bool:
+        """Set the vertical header for a row; returns False if the text is unchanged."""
+        meta = self.rows_meta[row_idx]
+        header = f"{meta['sifu_name']} \nRequired: {meta['sil_required']}\n {meta['demand_mode_required']}"
+        if header == meta.get("_cached_header"):
+            return False
+        meta["_cached_header"] = header
+        self.table.setVerticalHeaderItem(row_idx, QTableWidgetItem(header))
+        return True
+
+    def _widgets_for_row(self, row_idx: int) -> Optional[SifuRowWidgets]:
+        uid = self._row_uid_for_index(row_idx)
+        return self.sifu_widgets.get(uid) if uid else None
+
     def _lane_name_for_column(self, column: int) -> Optional[str]:
         mapping = {0: "sensor", 1: "logic", 2: "actuator"}
         return mapping.get(column)
 
     def _list_for_lane(self, row_idx: int, lane: Optional[str]) -> Optional[ChipList]:
-        widgets = self.sifu_widgets.get(row_idx)
+        widgets = self._widgets_for_row(row_idx)
         if not widgets or not lane:
             return None
         if lane == "sensor":
@@ -2548,51 +3131,55 @@ class MainWindow(QMainWindow):
             return widgets.out_list
         return None
 
-    def _row_lane_for_list(self, list_widget: Optional[ChipList]) -> Tuple[int, Optional[str]]:
+    def _row_uid_lane_for_list(self, list_widget: Optional[ChipList]) -> Tuple[Optional[str], Optional[str]]:
         if list_widget is None:
-            return -1, None
-        for idx, widgets in self.sifu_widgets.items():
+            return None, None
+        for uid, widgets in self.sifu_widgets.items():
             if list_widget is widgets.in_list:
-                return idx, "sensor"
+                return uid, "sensor"
             if list_widget is widgets.logic_list:
-                return idx, "logic"
+                return uid, "logic"
             if list_widget is widgets.out_list:
-                return idx, "actuator"
-        return -1, None
+                return uid, "actuator"
+        return None, None
+
+    def _row_lane_for_list(self, list_widget: Optional[ChipList]) -> Tuple[int, Optional[str]]:
+        uid, lane = self._row_uid_lane_for_list(list_widget)
+        if uid is None:
+            return -1, None
+        return self._row_index_from_uid(uid), lane
 
     @staticmethod
     def _sanitize_link_color(value: Optional[str]) -> Optional[str]:
         if not isinstance(value, str):
             return None
-        candidate = value.strip()
-        if not candidate:
-            return None
-        if re.fullmatch(r'#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})', candidate):
-            # Normalise to lowercase hex for stable comparisons
-            if len(candidate) == 4:  # short form like #abc
-                # Expand to 6-digit for consistency
-                r, g, b = candidate[1], candidate[2], candidate[3]
-                candidate = f"#{r}{r}{g}{g}{b}{b}"
-            return candidate.lower()
-        return None
+        return canonical_link_color(value)
 
     @staticmethod
     def _normalize_link_group_id(group_id: Optional[str]) -> Optional[str]:
         if not isinstance(group_id, str):
             return None
-        normalized = group_id.strip()
-        if not normalized:
-            return None
-        parts = normalized.split(":")
-        if len(parts) == 3 and parts[1] in {"sensor", "logic", "actuator"}:
-            return f"{parts[0]}:{parts[2]}"
-        return normalized
+        return canonical_link_group_id(group_id)
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def _group_id_for_color(row_uid: str, color: str) -> str:
         token = color.lower().lstrip('#') or color.lower()
         return f"{row_uid}:{token}"
 
+    def _bind_link_to_row(self, entry: dict, row_uid: str) -> dict:
+        """Return entry with its link group id scoped to row_uid, as _sum_lists expects it."""
+        color = self._sanitize_link_color(entry.get('link_color'))
+        if not color:
+            return entry
+        group_id = self._group_id_for_color(row_uid, color)
+        if entry.get('link_color') == color and entry.get('link_group_id') == group_id:
+            return entry
+        bound = dict(entry)
+        bound['link_color'] = color
+        bound['link_group_id'] = group_id
+        return bound
+
     def _color_icon(self, color: str) -> QIcon:
         pix = QPixmap(16, 16)
         pix.fill(QColor(color))
@@ -2776,7 +3363,7 @@ class MainWindow(QMainWindow):
                 f"Link mode extended to {lane_label} lane", 2500
             )
         payload = item.data(Qt.UserRole) or {}
-        updated = copy.deepcopy(payload)
+        updated = dict(payload)
         current_id = updated.get("link_group_id")
         changed = False
         if current_id == self._link_active_group_id:
@@ -2823,7 +3410,7 @@ class MainWindow(QMainWindow):
             if not item:
                 continue
             payload = item.data(Qt.UserRole) or {}
-            updated = copy.deepcopy(payload)
+            updated = dict(payload)
             removed = False
             if updated.pop("link_color", None) is not None:
                 removed = True
@@ -2863,7 +3450,7 @@ class MainWindow(QMainWindow):
             row_uid = self._ensure_row_uid(meta)
             if not row_uid:
                 continue
-            widgets = self.sifu_widgets.get(row_idx)
+            widgets = self._widgets_for_row(row_idx)
             if not widgets:
                 continue
             seen: Set[str] = set()
@@ -2880,14 +3467,14 @@ class MainWindow(QMainWindow):
                     if color:
                         group_id = self._group_id_for_color(row_uid, color)
                         if payload.get("link_group_id") != group_id or payload.get("link_color") != color:
-                            updated = copy.deepcopy(payload)
+                            updated = dict(payload)
                             updated["link_color"] = color
                             updated["link_group_id"] = group_id
                             item.setData(Qt.UserRole, updated)
                         seen.add(group_id)
                     else:
                         if payload.get("link_group_id"):
-                            updated = copy.deepcopy(payload)
+                            updated = dict(payload)
                             updated.pop("link_group_id", None)
                             item.setData(Qt.UserRole, updated)
             if seen:
@@ -2899,7 +3486,7 @@ class MainWindow(QMainWindow):
         for member in entry.get('members', []):
             if not isinstance(member, dict):
                 continue
-            member_copy = copy.deepcopy(member)
+            member_copy = clone_payload(member)
             inst_id = member_copy.get('instance_id')
             if not isinstance(inst_id, str) or not inst_id:
                 member_copy['instance_id'] = new_instance_id()
@@ -2919,14 +3506,14 @@ class MainWindow(QMainWindow):
             'architecture': '1oo2',
             'members': members,
             'kind': kind,
-            'instance_id': entry.get('instance_id', new_instance_id()),
+            'instance_id': entry.get('instance_id') or new_instance_id(),
         }
         color = self._sanitize_link_color(entry.get('link_color'))
         if color:
             payload['link_color'] = color
-        group_id = self._normalize_link_group_id(entry.get('link_group_id'))
-        if group_id:
-            payload['link_group_id'] = group_id
+            group_id = self._normalize_link_group_id(entry.get('link_group_id'))
+            if group_id:
+                payload['link_group_id'] = group_id
         item.setData(Qt.UserRole, payload)
 
         try:
@@ -2940,53 +3527,78 @@ class MainWindow(QMainWindow):
         return item
 
     def _build_html_report(self) -> str:
-        '''Build a self-contained HTML report (print-friendly) with all SIFUs,
-        their components, assumptions, DU/DD ratios and computed results.'''
-        import html as _html
+        '''Return the HTML report as a single string (see _write_html_report).'''
+        buf = io.StringIO()
+        self._write_html_report(buf)
+        return buf.getvalue()
+
+    def _write_html_report(self, out: TextIO) -> None:
+        '''Write a self-contained HTML report (print-friendly) with all SIFUs,
+        their components, assumptions, DU/DD ratios and computed results to `out`.
+        Sections are written as they are rendered, so exporting to a file never
+        holds the whole document in memory.'''
         from datetime import datetime as _dt
         dt = _dt.now().strftime('%Y-%m-%d %H:%M')
 
+        # Per-report memoisation: colours, labels and metric values repeat a lot
+        # across cards and tables. The caches live only for this export.
+        @lru_cache(maxsize=2048)
+        def _esc_text(text: str) -> str:
+            return text.translate(_ESC_TABLE)
+
         def esc(x):
-            return _html.escape('' if x is None else str(x))
+            return _esc_text('' if x is None else str(x))
+
+        @lru_cache(maxsize=512)
+        def _clean_color(value: str) -> Optional[str]:
+            candidate = value.strip()
+            return candidate if is_hex_color(candidate) else None
 
         def sanitize_color(value: Any) -> Optional[str]:
             if not isinstance(value, str):
                 return None
-            candidate = value.strip()
-            if re.fullmatch(r'#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})', candidate):
-                return candidate
-            return None
+            return _clean_color(value)
+
+        @lru_cache(maxsize=512)
+        def chip_color(link_color: Any, color: Any = None) -> Optional[str]:
+            """Sanitised chip colour: explicit link colour first, plain colour as fallback."""
+            return sanitize_color(link_color or color)
+
+        _pfd_text = lru_cache(maxsize=2048)(_FMT_PFD)
+        _pfh_text = lru_cache(maxsize=2048)(_FMT_PFH)  # 1/h
+
+        @lru_cache(maxsize=2048)
+        def _fit_text(value: float) -> str:
+            return _FMT_FIT(value * 1e9)
 
         def fmt_pfd(x):
             try:
-                return f"{float(x):.6f}"
+                value = float(x)
             except Exception:
                 return "–"
+            return _pfd_text(value)
 
         def fmt_pfh(x):
             try:
-                return f"{float(x):.3e}"  # 1/h
+                value = float(x)
             except Exception:
                 return "–"
+            return _pfh_text(value)
 
         def fmt_fit(x):
             try:
-                return f"{float(x) * 1e9:.2f}"
+                value = float(x)
             except Exception:
                 return "–"
+            return _fit_text(value)
 
         # Collect all data using existing helpers
         payload = {"sifus": []}
-        lane_display_map = {
-            'sensor': 'Sensors / Inputs',
-            'logic': 'Logic',
-            'actuator': 'Outputs / Actuators',
-        }
         for row_idx in range(len(self.rows_meta)):
             meta = self.rows_meta[row_idx]
-            widgets = self.sifu_widgets[row_idx]
+            widgets = self.sifu_widgets[self._ensure_row_uid(meta)]
             mode = self._effective_demand_mode(row_idx)
-            mode_key = "low_demand" if "low" in mode.lower() else "high_demand"
+            mode_key = demand_mode_key(mode)
             sensors = self._collect_list_items(widgets.in_list, 'sensor', mode_key)
             logic = self._collect_list_items(widgets.logic_list, 'logic', mode_key)
             outputs = self._collect_list_items(widgets.out_list, 'actuator', mode_key)
@@ -2994,9 +3606,8 @@ class MainWindow(QMainWindow):
                 (widgets.in_list, widgets.logic_list, widgets.out_list),
                 mode_key,
             )
-            combined_groups: List[Dict[str, Any]] = []
-            if isinstance(subgroup_info, dict):
-                combined_groups = copy.deepcopy(subgroup_info.get('combined', []) or [])
+            # _sum_lists builds a fresh payload on every call, so it can be stored as-is.
+            combined_groups: List[Dict[str, Any]] = subgroup_info.get('combined') or []
             sil_calc = classify_sil_from_pfh(pfh_sum) if 'high' in mode.lower() else classify_sil_from_pfd(pfd_sum)
             req_sil_str, req_rank_raw = normalize_required_sil(meta.get('sil_required', 'n.a.'))
             req_rank = int(req_rank_raw)
@@ -3025,137 +3636,22 @@ class MainWindow(QMainWindow):
         asm = self.assumptions
         ratios = self.du_dd_ratios
 
-        # CSS (embedded, print-friendly)
-        css = '''
-        body { font: 14px/1.45 -apple-system, Segoe UI, Roboto, Helvetica, Arial, sans-serif; color: #111; margin: 0; background: #fff; }
-        .page { padding: 24px 28px 40px; }
-        h1 { font-size: 22px; margin: 0 0 8px; }
-        h2 { font-size: 18px; margin: 24px 0 8px; border-bottom: 1px solid #e5e7eb; padding-bottom: 4px; }
-        h3 { font-size: 16px; margin: 18px 0 6px; }
-        .meta { color: #4b5563; font-size: 13px; margin-bottom: 12px; }
-        table { border-collapse: collapse; width: 100%; margin: 8px 0 16px; font-size: 13px; }
-        th, td { border: 1px solid #e5e7eb; padding: 6px 8px; text-align: left; vertical-align: top; }
-        th { background: #f8fafc; font-weight: 600; }
-        tbody tr:nth-child(even) { background:#f9fafb; }
-        tbody tr:hover { background:#f1f5f9; }
-        table.component-table { table-layout: fixed; }
-        table.component-table col.col-code { width: 32%; }
-        table.component-table col.col-pfd { width: 14%; }
-        table.component-table col.col-pfh { width: 16%; }
-        table.component-table col.col-fit { width: 14%; }
-        table.component-table col.col-sil { width: 14%; }
-        table.component-table col.col-pdm { width: 10%; }
-        table.component-table tbody tr.group-row td { background:#eef2ff; font-weight:600; border-bottom:0; }
-        table.component-table tbody tr.group-row:hover td { background:#e0e7ff; }
-        table.component-table tbody tr.group-row td .group-label { display:flex; flex-wrap:wrap; align-items:center; gap:8px; }
-        table.component-table tbody tr.group-row td .group-title { font-size:13px; }
-        table.component-table tbody tr.group-member td { background:#f9f5ff; border-top:0; font-size:12px; }
-        table.component-table tbody tr.group-member:hover td { background:#ede9fe; }
-        table.component-table tbody tr.group-member td:first-child { padding-left:30px; position:relative; }
-        table.component-table tbody tr.group-member td:first-child::before { content:'↳'; position:absolute; left:12px; top:50%; transform:translateY(-50%); color:#6366f1; font-size:12px; }
-        table.component-table td.right, table.component-table th.right { font-variant-numeric: tabular-nums; white-space: nowrap; }
-        .member-tag { display:inline-flex; align-items:center; padding:1px 6px; border-radius:999px; background:#ede9fe; color:#312e81; font-weight:600; }
-        .member-caption { display:inline-flex; align-items:center; color:#6b7280; font-size:11px; margin-top:0; }
-        .ok { color: #166534; font-weight: 600; }
-        .bad { color: #b91c1c; font-weight: 600; }
-        .pill { display:inline-flex; align-items:center; padding:2px 7px; border:1px solid #d1d5db; border-radius:999px; font-size:11px; font-weight:500; text-transform:uppercase; letter-spacing:0.04em; background:#f9fafb; color:#374151; }
-        .pill.arch, .lane-pill.arch { background:#ede9fe; color:#312e81; border:1px solid #c4b5fd; }
-        .grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(260px, 1fr)); gap: 12px; }
-        .card { border:1px solid #e5e7eb; border-radius:10px; padding:10px 12px; background:#fff; }
-        .muted { color:#6b7280; }
-        .small { font-size: 12px; }
-        .code { font-family: ui-monospace, SFMono-Regular, Menlo, Consolas, monospace; }
-        .right { text-align:right; }
-        .nowrap { white-space: nowrap; }
-        .architecture { margin: 18px 0 24px; }
-        .arch-lanes { display: grid; grid-template-columns: repeat(auto-fit, minmax(240px, 1fr)); gap: 16px; }
-        .lane { border:1px solid #e5e7eb; border-radius:12px; padding:12px 14px; background:#fff; box-shadow:0 6px 18px rgba(15,23,42,0.04); display:flex; flex-direction:column; }
-        .lane-header { font-size: 12px; letter-spacing: 0.08em; text-transform: uppercase; color:#1f2937; margin-bottom:10px; }
-        .lane-cards { display:flex; flex-direction:column; gap:4px; }
-        .lane-card { border:1px solid #e5e7eb; border-radius:10px; padding:8px 10px; background:#f9fafb; border-left:4px solid transparent; display:flex; flex-direction:column; gap:6px; }
-        .lane-card.group { background:#f5f3ff; border-color:#c7d2fe; border-left-color:#6366f1; }
-        .lane-card.empty { border-style: dashed; color:#9ca3af; background:#fff; border-left-color:transparent; }
-        .lane--sensors .lane-card { border-left-color:#0EA5E9; }
-        .lane--logic .lane-card { border-left-color:#22C55E; }
-        .lane--actuators .lane-card { border-left-color:#A855F7; }
-        .chip-link-dot { width:10px; height:10px; border-radius:999px; border:1px solid rgba(148,163,184,0.45); background:transparent; display:inline-flex; flex-shrink:0; }
-        .lane-card-header { display:flex; align-items:center; justify-content:space-between; gap:8px; }
-        .lane-title { display:flex; align-items:center; gap:6px; font-size:13px; font-weight:600; color:#111827; margin:0; }
-        .lane-title-text { display:inline-flex; align-items:center; }
-        .lane-subtitle { font-size:11px; color:#6b7280; margin:0; }
-        .lane-metrics { display:flex; flex-wrap:wrap; gap:6px; font-size:11px; color:#374151; }
-        .lane-metrics span { white-space:nowrap; padding:0 6px; border-radius:999px; background:#fff; border:1px solid #e5e7eb; }
-        .lane-pill { display:inline-flex; align-items:center; padding:2px 6px; border-radius:999px; background:#e5e7eb; color:#374151; font-size:10px; letter-spacing:0.05em; text-transform:uppercase; }
-        .lane-members { display:grid; grid-template-columns:repeat(auto-fit, minmax(150px, 1fr)); gap:4px; }
-        .lane-member { border:1px solid #d1d5db; border-radius:8px; padding:4px 6px; background:#fff; border-left:3px solid transparent; display:flex; flex-direction:column; gap:4px; }
-        .lane--sensors .lane-member { border-left-color:#0EA5E9; }
-        .lane--logic .lane-member { border-left-color:#22C55E; }
-        .lane--actuators .lane-member { border-left-color:#A855F7; }
-        .lane-member-title { display:flex; align-items:center; gap:6px; font-size:11px; color:#1f2937; font-weight:600; margin:0; }
-        .lane-member-text { color:#1f2937; }
-        .lane-member .lane-metrics { margin:0; gap:4px; font-size:10px; }
-        .lane-member .lane-metrics span { background:#f8fafc; border:1px solid #e2e8f0; padding:0 5px; }
-        .lane-group-meta { font-size:11px; color:#4b5563; }
-        .lane-note { font-size:11px; color:#6b7280; margin-top:4px; }
-        .component-label { display:flex; align-items:center; gap:6px; flex-wrap:wrap; }
-        .component-label-text { font-weight:600; color:#1f2937; }
-        .link-subgroup-box { margin-top:16px; border:1px solid #e5e7eb; border-radius:12px; padding:12px 14px; background:#fff; box-shadow:0 6px 18px rgba(15,23,42,0.04); }
-        .link-subgroup-heading { font-size:12px; letter-spacing:0.08em; text-transform:uppercase; color:#1f2937; margin:0 0 10px; }
-        .link-subgroup-list { display:flex; flex-direction:column; gap:10px; }
-        .link-subgroup-card { border:1px solid #e5e7eb; border-radius:10px; padding:10px 12px; background:#f9fafb; }
-        .link-subgroup-header { display:flex; align-items:center; justify-content:space-between; gap:8px; }
-        .link-subgroup-title { display:flex; align-items:center; gap:6px; font-size:13px; font-weight:600; }
-        .pill.subgroup { background:#dbeafe; color:#1d4ed8; border:1px solid #bfdbfe; }
-        .link-subgroup-color { width:14px; height:14px; border-radius:999px; border:1px solid rgba(17,24,39,0.18); }
-        .link-subgroup-lanes { font-size:12px; color:#4b5563; }
-        .link-subgroup-metrics { margin-top:6px; font-size:12px; color:#1f2937; font-variant-numeric:tabular-nums; }
-        .link-subgroup-members { margin-top:8px; display:flex; flex-wrap:wrap; gap:6px; }
-        .link-subgroup-member { display:inline-flex; align-items:center; gap:6px; padding:4px 8px; border-radius:999px; background:#ede9fe; color:#312e81; font-size:12px; }
-        .link-subgroup-member .lane { color:#4338ca; font-size:11px; }
-        .formula-section { margin: 24px 0; }
-        .formula-layout { display:flex; flex-wrap:wrap; gap:20px; align-items:stretch; }
-        .formula-column { display:flex; flex-direction:column; gap:16px; }
-        .formula-column--architecture { flex:1 1 340px; }
-        .formula-column--supporting { flex:1 1 260px; }
-        .formula-column--variables { flex:1 1 320px; min-width:280px; }
-        .formula-panel { flex:0 0 auto; border:1px solid #e5e7eb; border-radius:10px; background:#fff; box-shadow:0 6px 16px rgba(15,23,42,0.05); display:flex; flex-direction:column; min-width:240px; }
-        .formula-panel-header { padding:12px 16px; background:#f8fafc; color:#111827; font-weight:600; font-size:14px; border-bottom:1px solid #e5e7eb; }
-        .formula-panel-body { padding:12px 16px 16px; display:flex; flex-direction:column; gap:14px; }
-        .formula-box { border:1px solid #e5e7eb; border-radius:8px; background:#f9fafb; padding:12px 14px; }
-        .formula-note { margin:6px 0 0; }
-        .formula-table { width:100%; border-collapse:collapse; font-size:13px; }
-        .formula-table th, .formula-table td { border:1px solid #e5e7eb; padding:6px 8px; text-align:left; }
-        .formula-table th { background:#f8fafc; width:32%; }
-        @media (max-width: 960px) {
-            .formula-layout { flex-direction:column; }
-            .formula-column--variables { min-width:0; }
-        }
-        @media (max-width: 720px) {
-            .formula-panel { min-width:0; }
-        }
-        @media print { .page { padding: 0; } .no-print { display:none; } }
-        '''
-
         def build_architecture_lanes(sensors: List[dict], logic: List[dict], actuators: List[dict]) -> str:
-            stage_defs = [
-                ("sensors", "Sensors / Inputs", sensors or []),
-                ("logic", "Logic", logic or []),
-                ("actuators", "Outputs / Actuators", actuators or []),
-            ]
-
             stage_payload: List[Tuple[str, str, List[Dict[str, Any]]]] = []
 
-            for stage_key, stage_title, entries in stage_defs:
+            for stage_key, entries in zip(_STAGE_KEYS, (sensors, logic, actuators)):
+                stage_title = _STAGE_TITLES[stage_key]
+                entries = entries or []
                 cards: List[Dict[str, Any]] = []
                 for idx, entry in enumerate(entries):
                     architecture = entry.get("architecture")
                     instance_id = entry.get("instance_id") if isinstance(entry.get("instance_id"), str) else None
                     base_label = entry.get("code") or entry.get("name") or f"{stage_title} {idx + 1}"
-                    pfd_val = entry.get("pfd_avg", entry.get("pfd"))
-                    pfh_val = entry.get("pfh_avg", entry.get("pfh"))
-                    sil_val = entry.get("sys_cap", entry.get("syscap", ""))
+                    pfd_val = entry.get("pfd_avg")
+                    pfh_val = entry.get("pfh_avg")
+                    sil_val = entry.get("sys_cap", "")
                     pdm_val = entry.get("pdm_code", "")
-                    color = sanitize_color(entry.get("link_color") or entry.get("color"))
+                    color = chip_color(entry.get("link_color"), entry.get("color"))
 
                     note_text = self._note_for_provenance(entry.get("provenance"))
 
@@ -3167,13 +3663,13 @@ class MainWindow(QMainWindow):
                                 continue
                             member_label = member.get("code") or member.get("name") or f"Member {m_idx + 1}"
                             member_codes.append(member_label)
-                            member_color = sanitize_color(member.get("link_color") or color)
+                            member_color = chip_color(member.get("link_color"), color)
                             members_payload.append({
                                 "label": member_label,
                                 "name": member.get("name"),
-                                "pfd": member.get("pfd_avg", member.get("pfd")),
-                                "pfh": member.get("pfh_avg", member.get("pfh")),
-                                "sil": member.get("sys_cap", member.get("syscap", "")),
+                                "pfd": member["pfd_avg"],
+                                "pfh": member["pfh_avg"],
+                                "sil": member["sys_cap"],
                                 "pdm": member.get("pdm_code", ""),
                                 "note": self._note_for_provenance(member.get("provenance")),
                                 "color": member_color,
@@ -3233,9 +3729,7 @@ class MainWindow(QMainWindow):
 
             html_parts: List[str] = ['<div class="arch-lanes">']
             for stage_key, stage_title, cards in stage_payload:
-                html_parts.append(f'<div class="lane lane--{stage_key}">')
-                html_parts.append(f'<div class="lane-header">{esc(stage_title)}</div>')
-                html_parts.append('<div class="lane-cards">')
+                html_parts.append(_LANE_OPEN_HTML[stage_key])
                 if not cards:
                     html_parts.append('<div class="lane-card empty">No components listed</div>')
                 for card in cards:
@@ -3244,14 +3738,11 @@ class MainWindow(QMainWindow):
                         classes.append("group")
                     class_attr = " ".join(classes)
                     card_color = sanitize_color(card.get("color"))
-                    html_parts.append(f'<div class="{class_attr}">')
-                    html_parts.append('<div class="lane-card-header">')
-                    title_bits = ['<div class="lane-title">']
-                    if card_color:
-                        title_bits.append(f'<span class="chip-link-dot" style="background:{card_color};"></span>')
-                    title_bits.append(f'<span class="lane-title-text">{esc(card["label"])}</span>')
-                    title_bits.append('</div>')
-                    html_parts.append(''.join(title_bits))
+                    html_parts.append(f'<div class="{class_attr}"><div class="lane-card-header">')
+                    html_parts.append(_LANE_TITLE_TPL.format(
+                        dot=_LINK_DOT_TPL.format(color=card_color) if card_color else '',
+                        label=esc(card["label"]),
+                    ))
                     if card.get("architecture"):
                         html_parts.append(f'<span class="lane-pill arch">{esc(card["architecture"])}</span>')
                     html_parts.append('</div>')
@@ -3278,18 +3769,11 @@ class MainWindow(QMainWindow):
                             html_parts.append(f'<div class="lane-group-meta">Members ({len(members)})</div>')
                             html_parts.append('<div class="lane-members">')
                             for member in members:
-                                html_parts.append('<div class="lane-member">')
                                 member_color = sanitize_color(member.get("color"))
-                                member_title_bits = ['<div class="lane-member-title">']
-                                if member_color:
-                                    member_title_bits.append(
-                                        f'<span class="chip-link-dot" style="background:{member_color};"></span>'
-                                    )
-                                member_title_bits.append(
-                                    f'<span class="lane-member-text">{esc(member.get("label", "Member"))}</span>'
-                                )
-                                member_title_bits.append('</div>')
-                                html_parts.append(''.join(member_title_bits))
+                                html_parts.append(_LANE_MEMBER_TITLE_TPL.format(
+                                    dot=_LINK_DOT_TPL.format(color=member_color) if member_color else '',
+                                    label=esc(member.get("label", "Member")),
+                                ))
                                 member_metrics = render_metrics(member.get("pfd"), member.get("pfh"), member.get("sil"), member.get("pdm"))
                                 if member_metrics:
                                     html_parts.append(member_metrics)
@@ -3302,21 +3786,22 @@ class MainWindow(QMainWindow):
                         else:
                             html_parts.append('<div class="lane-note">Group members unavailable</div>')
                     html_parts.append('</div>')
-                html_parts.append('</div>')
-                html_parts.append('</div>')
+                html_parts.append(_LANE_CLOSE)
 
             html_parts.append('</div>')
             return ''.join(html_parts)
 
+        subgroup_metric_specs = (
+            ('pfd', 'PFDavg {0}', fmt_pfd),
+            ('pfh', 'PFHavg {0} 1/h', fmt_pfh),
+        )
+
         def render_link_subgroups(entries: Optional[List[Dict[str, Any]]]) -> str:
             if not entries:
                 return ""
 
             cards: List[str] = []
-            cards.append('<div class="link-subgroup-box">')
-            cards.append('<div class="link-subgroup-heading">Link subgroups</div>')
-            cards.append('<div class="link-subgroup-list">')
-            has_card = False
+            lane_title_cache: Dict[Any, str] = {}
             for idx, subgroup in enumerate(entries, 1):
                 if not isinstance(subgroup, dict):
                     continue
@@ -3327,323 +3812,220 @@ class MainWindow(QMainWindow):
                 if isinstance(lanes, (list, tuple)) and lanes:
                     lanes_display = ', '.join(str(l) for l in lanes if l)
 
-                metrics_bits: List[str] = []
-                pfd_val = subgroup.get('pfd')
-                if pfd_val not in (None, ''):
-                    metrics_bits.append(f"PFDavg {fmt_pfd(pfd_val)}")
-                pfh_val = subgroup.get('pfh')
-                if pfh_val not in (None, ''):
-                    metrics_bits.append(f"PFHavg {fmt_pfh(pfh_val)} 1/h")
+                metrics_bits = [
+                    tmpl.format(fmt(val))
+                    for key, tmpl, fmt in subgroup_metric_specs
+                    if (val := subgroup.get(key)) not in (None, '')
+                ]
                 count_val = subgroup.get('count')
                 if isinstance(count_val, int) and count_val > 0:
                     metrics_bits.append(f"{count_val} component{'s' if count_val != 1 else ''}")
 
-                cards.append('<div class="link-subgroup-card">')
-                has_card = True
-                cards.append('<div class="link-subgroup-header">')
-                title_parts = [f'<span class="pill subgroup">Subgroup {idx}</span>']
-                if color:
-                    title_parts.append(f'<span class="link-subgroup-color" style="background:{color};"></span>')
-                cards.append(f"<div class=\"link-subgroup-title\">{''.join(title_parts)}</div>")
+                color_html = f'<span class="link-subgroup-color" style="background:{color};"></span>' if color else ''
                 if lanes_display:
-                    cards.append(f'<div class="link-subgroup-lanes">Lanes: {esc(lanes_display)}</div>')
+                    lanes_html = f'<div class="link-subgroup-lanes">Lanes: {esc(lanes_display)}</div>'
                 else:
-                    cards.append('<div class="link-subgroup-lanes muted">Lanes: —</div>')
-                cards.append('</div>')
-
+                    lanes_html = '<div class="link-subgroup-lanes muted">Lanes: —</div>'
+                metrics_html = ''
                 if metrics_bits:
-                    cards.append(f"<div class=\"link-subgroup-metrics\">{' | '.join(metrics_bits)}</div>")
+                    metrics_html = f'<div class="link-subgroup-metrics">{" | ".join(metrics_bits)}</div>'
 
-                components = [comp for comp in subgroup.get('components', []) if isinstance(comp, dict)]
+                members_html = ''
+                components = subgroup.get('components', [])
                 if components:
-                    cards.append('<div class="link-subgroup-members">')
+                    member_bits: List[str] = []
                     for comp in components:
                         label_val = comp.get('label') or 'Component'
                         if comp.get('architecture') == '1oo2':
                             label_val = f"{label_val} (1oo2)"
-                        lane_title = comp.get('lane_title') or lane_display_map.get(comp.get('lane'), comp.get('lane', ''))
-                        lane_caption = esc(lane_title) if lane_title else ''
-                        member_labels = [lbl for lbl in comp.get('member_labels', []) if lbl]
-                        tooltip_attr = ''
-                        if member_labels:
-                            tooltip_attr = f' title="{esc("Members: " + ", ".join(member_labels))}"'
-                        comp_color = sanitize_color(comp.get('color') or subgroup.get('color'))
-                        cards.append(f'<div class="link-subgroup-member"{tooltip_attr}>')
-                        if comp_color:
-                            cards.append(f'<span class="chip-link-dot" style="background:{comp_color};"></span>')
-                        cards.append(f'<span class="member-tag">{esc(label_val)}</span>')
-                        if lane_caption:
-                            cards.append(f'<span class="lane">{lane_caption}</span>')
-                        cards.append('</div>')
-                    cards.append('</div>')
-
-                cards.append('</div>')
-
-            cards.append('</div>')
-            cards.append('</div>')
-            if not has_card:
+                        lane_title = comp.get('lane_title')
+                        if not lane_title:
+                            lane_key = comp.get('lane')
+                            lane_title = lane_title_cache.get(lane_key)
+                            if lane_title is None:
+                                lane_title = _LANE_TITLES.get(lane_key, comp.get('lane', ''))
+                                lane_title_cache[lane_key] = lane_title
+                        lane_html = _LANE_CAPTION_HTML.get(lane_title)
+                        if lane_html is None:
+                            lane_html = f'<span class="lane">{esc(lane_title)}</span>' if lane_title else ''
+                        members_text = ', '.join([lbl for lbl in comp.get('member_labels', []) if lbl])
+                        tooltip_attr = f' title="{esc(f"Members: {members_text}")}"' if members_text else ''
+                        comp_color = chip_color(comp.get('color'), subgroup.get('color'))
+                        member_bits.append(_SUBGROUP_MEMBER_TMPL.format_map({
+                            'tooltip': tooltip_attr,
+                            'dot': _LINK_DOT_TPL.format(color=comp_color) if comp_color else '',
+                            'label': esc(label_val),
+                            'lane': lane_html,
+                        }))
+                    members_html = f'<div class="link-subgroup-members">{"".join(member_bits)}</div>'
+
+                cards.append(
+                    '<div class="link-subgroup-card"><div class="link-subgroup-header">'
+                    f'<div class="link-subgroup-title"><span class="pill subgroup">Subgroup {idx}</span>{color_html}</div>'
+                    f'{lanes_html}</div>{metrics_html}{members_html}</div>'
+                )
+
+            if not cards:
                 return ""
-            return ''.join(cards)
-
-        def build_formula_reference() -> str:
-            section_parts: List[str] = []
-            section_parts.append('<section class="formula-section">')
-            section_parts.append('<h2>Base Formulas</h2>')
-
-            def render_formulas(entries: List[Tuple[str, str]]) -> str:
-                box_bits: List[str] = []
-                for latex, note in entries:
-                    box_bits.append('<div class="formula-box">')
-                    box_bits.append(f'\\[{latex}\\]')
-                    box_bits.append(f'<p class="formula-note muted small"><em>{esc(note)}</em></p>')
-                    box_bits.append('</div>')
-                return ''.join(box_bits)
-
-            def panel_block(title: str, inner_html: str) -> str:
-                block_parts: List[str] = []
-                block_parts.append('<div class="formula-panel">')
-                block_parts.append(f'<div class="formula-panel-header">{esc(title)}</div>')
-                block_parts.append('<div class="formula-panel-body">')
-                block_parts.append(inner_html)
-                block_parts.append('</div>')
-                block_parts.append('</div>')
-                return ''.join(block_parts)
-
-            oneoo1_entries = [
-                (r'PFD_{1oo1} = \lambda_{DU}(T_I/2 + MTTR) + \lambda_{DD}MTTR', 'Average probability of failure on demand for a single 1oo1 channel.'),
-                (r'PFH_{1oo1} = \lambda_{DU}', 'Dangerous failure rate per hour for a single 1oo1 channel.'),
-            ]
-            architecture_blocks = [
-                panel_block('1oo1 Architecture', render_formulas(oneoo1_entries)),
-            ]
-            oneoo2_entries = [
-                (r't_{CE} = \frac{\lambda_{DU}^{ind}}{\lambda_D^{ind}}(T_I/2 + MTTR) + \frac{\lambda_{DD}^{ind}}{\lambda_D^{ind}}MTTR', 'Exposure time for common-cause dangerous undetected combinations using independent channel rates.'),
-                (r't_{GE} = \frac{\lambda_{DU}^{ind}}{\lambda_D^{ind}}(T_I/3 + MTTR) + \frac{\lambda_{DD}^{ind}}{\lambda_D^{ind}}MTTR', 'Exposure time for general dangerous undetected combinations with staggered testing, independent portion.'),
-                (r'PFD_{1oo2} = 2(1-\beta)^2(\lambda_D)^2 t_{CE}t_{GE} \\[4pt]'
-                 r'+ \beta\lambda_{DU}(T_I/2 + MTTR) + \beta_D\lambda_{DD}MTTR', 'System-level probability of failure on demand for a redundant 1oo2 channel.'),
-                (r'PFH_{1oo2} = 2(1-\beta)\lambda_D^{ind}\lambda_{DU}^{ind}t_{CE} + \beta\lambda_{DU}', 'System-level dangerous failure rate per hour for a redundant 1oo2 channel.'),
-            ]
-            architecture_blocks.append(
-                panel_block('1oo2 Architecture', render_formulas(oneoo2_entries))
-            )
+            return f'{_SUBGROUP_BOX_OPEN}{"".join(cards)}</div></div>'
 
-            supporting_entries = [
-                (r'\lambda_D = \lambda_{DU} + \lambda_{DD}', 'Total dangerous failure rate split into undetected and detected parts.'),
-                (r'\lambda_{DU} = r_{DU}\lambda_D,\ \lambda_{DD} = r_{DD}\lambda_D', 'Ratios mapping total dangerous failures to undetected and detected portions.'),
-                (r'\lambda_{DU}^{ind} = (1-\beta)\lambda_{DU},\ \lambda_{DD}^{ind} = (1-\beta_D)\lambda_{DD}', 'Independent channel failure rates after removing common cause factors.'),
-            ]
-            supporting_block = panel_block('Supporting Relations', render_formulas(supporting_entries))
-
-            var_rows: List[Tuple[str, str]] = [
-                (r't_{CE}', 'Exposure window for common-cause dangerous undetected failures.'),
-                (r't_{GE}', 'Exposure window for general dangerous undetected failures.'),
-                (r'\lambda_{DU}', 'Dangerous undetected failure rate.'),
-                (r'\lambda_{DD}', 'Dangerous detected failure rate.'),
-                (r'\lambda_D', 'Total dangerous failure rate (detected + undetected).'),
-                (r'\lambda_D^{ind}', 'Independent-channel total dangerous failure rate (excludes common cause).'),
-                (r'\lambda_{DU}^{ind}', 'Channel-specific dangerous undetected failure rate (independent portion).'),
-                (r'\lambda_{DD}^{ind}', 'Channel-specific dangerous detected failure rate (independent portion).'),
-                (r'r_{DU}', 'Fraction of dangerous failures that are undetected.'),
-                (r'r_{DD}', 'Fraction of dangerous failures that are detected.'),
-                (r'\beta', 'Common cause factor for dangerous undetected failures.'),
-                (r'\beta_D', 'Common cause factor for dangerous detected failures.'),
-                (r'T_I', 'Proof-test interval.'),
-                (r'MTTR', 'Mean time to repair.'),
-            ]
-            table_parts: List[str] = ['<div class="formula-box">', '<table class="formula-table"><thead><tr><th>Symbol</th><th>Meaning</th></tr></thead><tbody>']
-            for symbol, meaning in var_rows:
-                table_parts.append('<tr>')
-                table_parts.append(f'<td class="nowrap">\\({symbol}\\)</td>')
-                table_parts.append(f'<td>{esc(meaning)}</td>')
-                table_parts.append('</tr>')
-            table_parts.append('</tbody></table></div>')
-            variable_block = panel_block('Variable Summary', ''.join(table_parts))
-
-            section_parts.append('<div class="formula-layout">')
-            section_parts.append('<div class="formula-column formula-column--architecture">')
-            section_parts.extend(architecture_blocks)
-            section_parts.append('</div>')
-            section_parts.append('<div class="formula-column formula-column--supporting">')
-            section_parts.append(supporting_block)
-            section_parts.append('</div>')
-            section_parts.append('<div class="formula-column formula-column--variables">')
-            section_parts.append(variable_block)
-            section_parts.append('</div>')
-            section_parts.append('</div>')
-
-            section_parts.append('</section>')
-            return ''.join(section_parts)
-
-        # Build HTML
-        parts = []
-        parts.append('<!doctype html><html><head><meta charset="utf-8">')
-        parts.append('<meta name="viewport" content="width=device-width,initial-scale=1">')
-        parts.append('<title>SIFU Report</title>')
-        parts.append(f'<style>{css}</style>')
-        parts.append('<script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>')
-        parts.append('<script id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>')
-        parts.append('</head><body>')
-        parts.append('<div class="page">')
-        parts.append('<h1>SIFU Calculation Report</h1>')
-        parts.append(f'<div class="meta">Generated: {esc(dt)}</div>')
+        # Build HTML (fragments are newline-separated)
+        write = out.write
+
+        def emit(*chunks: str) -> None:
+            for chunk in chunks:
+                write(chunk)
+                write('\n')
+
+        emit(_REPORT_HEAD, f'<div class="meta">Generated: {esc(dt)}</div>')
 
         # Summary table
-        parts.append('<h2>Summary</h2>')
-        parts.append('<table><thead><tr><th>#</th><th>SIFU</th><th>Demand mode (effective)</th><th>Required SIL</th><th>Calculated SIL</th><th class="right">PFDsum</th><th class="right">PFHsum [1/h]</th><th>Status</th></tr></thead><tbody>')
-        for i, s in enumerate(payload["sifus"], 1):
-            status = '<span class="ok">meets</span>' if s['ok'] else '<span class="bad">fails</span>'
-            parts.append(
-                '<tr>'
-                f'<td class="nowrap">{i}</td>'
-                f'<td>{esc(s["meta"].get("sifu_name", f"SIFU {i}"))}</td>'
-                f'<td>{esc(s["mode"])}</td>'
-                f'<td>{esc(s["req_sil"])}</td>'
-                f'<td>{esc(s["sil_calc"])}</td>'
-                f'<td class="right">{fmt_pfd(s["pfd_sum"])}</td>'
-                f'<td class="right">{fmt_pfh(s["pfh_sum"])}</td>'
-                f'<td>{status}</td>'
-                '</tr>'
-            )
-        parts.append('</tbody></table>')
+        emit(_SUMMARY_TABLE_OPEN)
+        if payload["sifus"]:
+            emit('\n'.join([
+                _SUMMARY_ROW_TMPL % (
+                    i,
+                    esc(s["meta"].get("sifu_name", f"SIFU {i}")),
+                    esc(s["mode"]),
+                    esc(s["req_sil"]),
+                    esc(s["sil_calc"]),
+                    fmt_pfd(s["pfd_sum"]),
+                    fmt_pfh(s["pfh_sum"]),
+                    _STATUS_BADGE[bool(s['ok'])],
+                )
+                for i, s in enumerate(payload["sifus"], 1)
+            ]))
+        emit('</tbody></table>')
 
-        parts.append(build_formula_reference())
+        emit(_formula_reference_html())
 
         # Assumptions & Ratios
-        parts.append('<div class="grid">')
-        parts.append('<div class="card">')
-        parts.append('<h3>Global Assumptions</h3>')
-        parts.append('<table><tbody>')
-        parts.append(f'<tr><th>TI — Proof-test interval [h]</th><td class="right">{asm.get("TI", 0):.2f}</td></tr>')
-        parts.append(f'<tr><th>MTTR — Mean time to repair [h]</th><td class="right">{asm.get("MTTR", 0):.2f}</td></tr>')
-        parts.append(f'<tr><th>beta — CCF (DU) [–]</th><td class="right">{asm.get("beta", 0):.4f}</td></tr>')
-        parts.append(f'<tr><th>beta_D — CCF (DD) [–]</th><td class="right">{asm.get("beta_D", 0):.4f}</td></tr>')
-        parts.append('</tbody></table>')
-        parts.append('</div>')
-
-        parts.append('<div class="card">')
-        parts.append('<h3>DU/DD Ratios (per group)</h3>')
-        parts.append('<table><thead><tr><th>Group</th><th class="right">DU [–]</th><th class="right">DD [–]</th></tr></thead><tbody>')
+        emit(
+            '<div class="grid">',
+            '<div class="card">',
+            '<h3>Global Assumptions</h3>',
+            '<table><tbody>',
+            f'<tr><th>TI — Proof-test interval [h]</th><td class="right">{asm.get("TI", 0):.2f}</td></tr>',
+            f'<tr><th>MTTR — Mean time to repair [h]</th><td class="right">{asm.get("MTTR", 0):.2f}</td></tr>',
+            f'<tr><th>beta — CCF (DU) [–]</th><td class="right">{asm.get("beta", 0):.4f}</td></tr>',
+            f'<tr><th>beta_D — CCF (DD) [–]</th><td class="right">{asm.get("beta_D", 0):.4f}</td></tr>',
+            '</tbody></table>',
+            '</div>',
+        )
+
+        emit(
+            '<div class="card">',
+            '<h3>DU/DD Ratios (per group)</h3>',
+            '<table><thead><tr><th>Group</th><th class="right">DU [–]</th><th class="right">DD [–]</th></tr></thead><tbody>',
+        )
         for g in ("sensor","logic","actuator"):
             du, dd = ratios.get(g, (0.6, 0.4))
-            parts.append(f'<tr><td>{g}</td><td class="right">{du:.2f}</td><td class="right">{dd:.2f}</td></tr>')
-        parts.append('</tbody></table>')
-        parts.append('</div>')
-        parts.append('</div>')
+            emit(f'<tr><td>{g}</td><td class="right">{du:.2f}</td><td class="right">{dd:.2f}</td></tr>')
+        emit('</tbody></table>', '</div>', '</div>')
 
         # Detailed sections per SIFU
         for i, s in enumerate(payload["sifus"], 1):
             meta = s['meta']
-            parts.append(f'<h2>#{i} — {esc(meta.get("sifu_name", f"SIFU {i}"))}</h2>')
-            parts.append('<table><tbody>')
-            parts.append(f'<tr><th>Required SIL</th><td>{esc(s["req_sil"])}</td></tr>')
-            parts.append(f'<tr><th>Demand mode</th><td>Required: {esc(meta.get("demand_mode_required", "High demand"))} | Effective: {esc(s["mode"])}</td></tr>')
             ov = meta.get('demand_mode_override', None)
-            parts.append(f'<tr><th>Override</th><td>{esc(ov) if ov else "—"}</td></tr>')
-            status = '<span class="ok">meets</span>' if s['ok'] else '<span class="bad">fails</span>'
-            parts.append(f'<tr><th>Calculated SIL</th><td>{esc(s["sil_calc"])}, {status}</td></tr>')
-            parts.append(f'<tr><th>Totals</th><td>PFDsum = {fmt_pfd(s["pfd_sum"])} | PFHsum = {fmt_pfh(s["pfh_sum"])} 1/h</td></tr>')
-            parts.append('</tbody></table>')
+            status = _STATUS_BADGE[bool(s['ok'])]
+            emit(
+                f'<h2>#{i} — {esc(meta.get("sifu_name", f"SIFU {i}"))}</h2>',
+                '<table><tbody>',
+                f'<tr><th>Required SIL</th><td>{esc(s["req_sil"])}</td></tr>',
+                f'<tr><th>Demand mode</th><td>Required: {esc(meta.get("demand_mode_required", "High demand"))} | Effective: {esc(s["mode"])}</td></tr>',
+                f'<tr><th>Override</th><td>{esc(ov) if ov else "—"}</td></tr>',
+                f'<tr><th>Calculated SIL</th><td>{esc(s["sil_calc"])}, {status}</td></tr>',
+                f'<tr><th>Totals</th><td>PFDsum = {fmt_pfd(s["pfd_sum"])} | PFHsum = {fmt_pfh(s["pfh_sum"])} 1/h</td></tr>',
+                '</tbody></table>',
+            )
 
             arch_html = build_architecture_lanes(s['sensors'], s['logic'], s['actuators'])
             subgroup_html = render_link_subgroups(s.get('link_subgroups'))
             if arch_html or subgroup_html:
-                parts.append('<div class="architecture">')
-                if arch_html:
-                    parts.append('<h3>Architecture overview</h3>')
-                    parts.append(arch_html)
-                if subgroup_html:
-                    parts.append(subgroup_html)
-                parts.append('</div>')
+                arch_block = f'<h3>Architecture overview</h3>\n{arch_html}\n' if arch_html else ''
+                subgroup_block = f'{subgroup_html}\n' if subgroup_html else ''
+                write(f'<div class="architecture">\n{arch_block}{subgroup_block}</div>\n')
 
             def render_group(title, items):
-                parts.append(f'<h3>{esc(title)}</h3>')
+                emit(f'<h3>{esc(title)}</h3>')
                 if not items:
-                    parts.append('<div class="muted small">No items</div>')
+                    emit('<div class="muted small">No items</div>')
                     return
-                parts.append('<table class="component-table"><colgroup><col class="col-code"><col class="col-pfd"><col class="col-pfh"><col class="col-fit"><col class="col-sil"><col class="col-pdm"></colgroup><thead><tr><th>Code / Name</th><th class="right">PFDavg</th><th class="right">PFHavg [1/h]</th><th class="right">PFH [FIT]</th><th>SIL capability</th><th>PDM code</th></tr></thead><tbody>')
+                emit(_COMPONENT_TABLE_OPEN)
                 for it in items:
-                    if it.get('architecture') == '1oo2':
-                        pfd_g = it.get('pfd_avg', 0.0)
+                    arch = it.get('architecture')
+                    color = chip_color(it.get('link_color'), it.get('color'))
+                    if arch == '1oo2':
                         pfh_g = it.get('pfh_avg', 0.0)
                         members = it.get('members', [])
-                        member_codes = [m.get('code') or m.get('name') or f'Member {idx + 1}' for idx, m in enumerate(members)]
-                        group_title = ' ∥ '.join([c for c in member_codes if c]) or '1oo2 redundant set'
-                        group_color = sanitize_color(it.get('link_color') or it.get('color'))
-                        group_label_bits = ['<div class="group-label">', '<span class="pill arch">1oo2</span>']
-                        if group_color:
-                            group_label_bits.append(f'<span class="chip-link-dot" style="background:{group_color};"></span>')
-                        group_label_bits.append(f'<span class="group-title">{esc(group_title)}</span>')
-                        group_label_bits.append('</div>')
-                        group_label_html = ''.join(group_label_bits)
-                        parts.append('<tr class="group-row">'
-                                     f'<td>{group_label_html}</td>'
-                                     f'<td class="right">{fmt_pfd(pfd_g)}</td>'
-                                     f'<td class="right">{fmt_pfh(pfh_g)}</td>'
-                                     f'<td class="right">{fmt_fit(pfh_g)}</td>'
-                                     '<td>—</td><td>—</td></tr>')
+                        group_title = ' ∥ '.join(
+                            m.get('code') or m.get('name') or f'Member {idx}' for idx, m in enumerate(members, 1)
+                        ) or '1oo2 redundant set'
+                        emit(_COMPONENT_ROW_TMPL.format_map({
+                            'row_class': ' class="group-row"',
+                            'label': _GROUP_LABEL_TMPL.format(
+                                dot=_LINK_DOT_TPL.format(color=color) if color else '',
+                                title=esc(group_title),
+                            ),
+                            'pfd': fmt_pfd(it.get('pfd_avg', 0.0)),
+                            'pfh': fmt_pfh(pfh_g),
+                            'fit': fmt_fit(pfh_g),
+                            'sil': '—',
+                            'pdm': '—',
+                        }))
                         for m_idx, m in enumerate(members, 1):
                             code_val = m.get('code') or m.get('name') or f'Member {m_idx}'
                             name_val = m.get('name')
-                            member_color = sanitize_color(m.get('link_color') or m.get('color') or group_color)
-                            label_bits = ['<div class="component-label">']
-                            if member_color:
-                                label_bits.append(f'<span class="chip-link-dot" style="background:{member_color};"></span>')
-                            label_bits.append(f'<span class="member-tag">{esc(code_val)}</span>')
-                            if name_val and name_val != code_val:
-                                label_bits.append(f'<span class="member-caption">{esc(name_val)}</span>')
-                            label_bits.append('</div>')
+                            member_color = chip_color(m.get('link_color'), m.get('color') or color)
                             note = self._note_for_provenance(m.get('provenance'))
-                            if note:
-                                label_bits.append(f"<div class=\"lane-note\">{esc(note)}</div>")
-                            label_html = ''.join(label_bits)
-                            parts.append('<tr class="group-member">'
-                                         f'<td>{label_html}</td>'
-                                         f'<td class="right">{fmt_pfd(m.get("pfd_avg", m.get("pfd")))}</td>'
-                                         f'<td class="right">{fmt_pfh(m.get("pfh_avg", m.get("pfh")))}</td>'
-                                         f'<td class="right">{fmt_fit(m.get("pfh_avg", m.get("pfh")))}</td>'
-                                         f'<td>{esc(m.get("sys_cap", m.get("syscap", "")) or "—")}</td>'
-                                         f'<td>{esc(m.get("pdm_code", "") or "—")}</td>'
-                                         '</tr>')
+                            pfh_m = m["pfh_avg"]
+                            emit(_COMPONENT_ROW_TMPL.format_map({
+                                'row_class': ' class="group-member"',
+                                'label': _MEMBER_LABEL_TMPL.format(
+                                    dot=_LINK_DOT_TPL.format(color=member_color) if member_color else '',
+                                    label=esc(code_val),
+                                    caption=(_MEMBER_CAPTION_TMPL.format(caption=esc(name_val))
+                                             if name_val and name_val != code_val else ''),
+                                    note=_LANE_NOTE_TMPL.format(note=esc(note)) if note else '',
+                                ),
+                                'pfd': fmt_pfd(m["pfd_avg"]),
+                                'pfh': fmt_pfh(pfh_m),
+                                'fit': fmt_fit(pfh_m),
+                                'sil': esc(m["sys_cap"] or "—"),
+                                'pdm': esc(m.get("pdm_code", "") or "—"),
+                            }))
                     else:
-                        item_color = sanitize_color(it.get('link_color') or it.get('color'))
-                        label_bits = ['<div class="component-label">']
-                        if item_color:
-                            label_bits.append(f'<span class="chip-link-dot" style="background:{item_color};"></span>')
-                        code_label = esc(it.get("code", it.get("name", "?")))
-                        label_bits.append(f'<span class="component-label-text">{code_label}</span>')
-                        label_bits.append('</div>')
                         note = self._note_for_provenance(it.get('provenance'))
-                        if note:
-                            label_bits.append(f"<div class=\"lane-note\">{esc(note)}</div>")
-                        label_html = ''.join(label_bits)
-                        parts.append('<tr>'
-                                     f'<td>{label_html}</td>'
-                                     f'<td class="right">{fmt_pfd(it.get("pfd_avg", it.get("pfd")))}</td>'
-                                     f'<td class="right">{fmt_pfh(it.get("pfh_avg", it.get("pfh")))}</td>'
-                                     f'<td class="right">{fmt_fit(it.get("pfh_avg", it.get("pfh")))}</td>'
-                                     f'<td>{esc(it.get("sys_cap", it.get("syscap","")) or "—")}</td>'
-                                     f'<td>{esc(it.get("pdm_code", "") or "—")}</td>'
-                                     '</tr>')
-                parts.append('</tbody></table>')
+                        pfh_i = it["pfh_avg"]
+                        emit(_COMPONENT_ROW_TMPL.format_map({
+                            'row_class': '',
+                            'label': _COMPONENT_LABEL_TMPL.format(
+                                dot=_LINK_DOT_TPL.format(color=color) if color else '',
+                                label=esc(it.get('code') or it.get('name') or '?'),
+                                note=_LANE_NOTE_TMPL.format(note=esc(note)) if note else '',
+                            ),
+                            'pfd': fmt_pfd(it["pfd_avg"]),
+                            'pfh': fmt_pfh(pfh_i),
+                            'fit': fmt_fit(pfh_i),
+                            'sil': esc(it["sys_cap"] or "—"),
+                            'pdm': esc(it.get("pdm_code", "") or "—"),
+                        }))
+                emit('</tbody></table>')
 
 
             render_group('Sensors / Inputs', s['sensors'])
             render_group('Logic', s['logic'])
             render_group('Outputs / Actuators', s['actuators'])
 
-        parts.append('<div class="muted small">This report is generated for documentation support of IEC 61508 evaluations. Ensure project-specific assumptions and operational profiles are validated.</div>')
-        parts.append('</div>')
-        parts.append('</body></html>')
-
-        return '\n'.join(parts)
+        write(_REPORT_FOOTER)
 
     def _collect_assignment_payload(self) -> dict:
         out = {"sifus": []}
         for row_idx in range(len(self.rows_meta)):
             meta = self.rows_meta[row_idx]
-            widgets = self.sifu_widgets[row_idx]
+            widgets = self.sifu_widgets[self._ensure_row_uid(meta)]
             mode = self._effective_demand_mode(row_idx)
-            mode_key = "low_demand" if "low" in mode.lower() else "high_demand"
+            mode_key = demand_mode_key(mode)
             sensors = self._collect_list_items(widgets.in_list, 'sensor', mode_key)
             logic   = self._collect_list_items(widgets.logic_list, 'logic', mode_key)
             outputs = self._collect_list_items(widgets.out_list, 'actuator', mode_key)
@@ -3667,99 +4049,109 @@ class MainWindow(QMainWindow):
         return out
 
     def _rebuild_from_payload(self, data: dict):
-        self.table.clearContents(); self.table.setRowCount(0)
-        self.rows_meta.clear(); self.sifu_widgets.clear()
+        self._clear_sifu_rows()
         sifus = data.get("sifus", [])
-        self.table.setRowCount(len(sifus))
-        for row_idx, sifu_data in enumerate(sifus):
-            req_sil_str, _ = normalize_required_sil(sifu_data.get("sil_required", "n.a."))
-            meta = RowMeta({
-                "sifu_name": sifu_data.get("sifu_name", f"SIFU {row_idx+1}"),
-                "sil_required": req_sil_str,
-                "demand_mode_required": sifu_data.get("demand_mode_required", "High demand"),
-                "demand_mode_override": sifu_data.get("demand_mode_override", None),
-                "source": "user"
-            })
-            self.rows_meta.append(meta)
-            self._ensure_row_uid(meta)
-
-            header = f"{meta['sifu_name']} \nRequired: {meta['sil_required']}\n {meta['demand_mode_required']}"
-            self.table.setVerticalHeaderItem(row_idx, QTableWidgetItem(header))
-
-            widgets = SifuRowWidgets()
-            self.sifu_widgets[row_idx] = widgets
-
-            effective = self._effective_demand_mode(row_idx)
-            widgets.result.combo.setCurrentText(effective)
-            widgets.result.override_changed.connect(lambda val, r=row_idx: self._on_row_override_changed(r, val))
-
-            self.table.setCellWidget(row_idx, 0, widgets.in_list)
-            self.table.setCellWidget(row_idx, 1, widgets.logic_list)
-            self.table.setCellWidget(row_idx, 2, widgets.out_list)
-            self.table.setCellWidget(row_idx, 3, widgets.result)
-
-            for sensor in sifu_data.get("sensors", []):
-                if sensor.get("architecture") == "1oo2":
-                    item = self._create_group_item(sensor, "sensor")
-                    widgets.in_list.addItem(item)
-                    widgets.in_list.attach_chip(item)
-                else:
-                    item = self._make_item(sensor.get("code", "?"), sensor.get("pfd_avg", 0.0), sensor.get("pfh_avg", 0.0), sensor.get("sys_cap", ""), sensor.get("pdm_code", ""), kind="sensor", extra_fields=sensor)
-                    widgets.in_list.addItem(item)
-                    widgets.in_list.attach_chip(item)
-
-            for logic in sifu_data.get("logic", []):
-                name = logic.get("code", logic.get("name", "Logic"))
-                item = self._make_item(name, logic.get("pfd_avg", 0.0), logic.get("pfh_avg", 0.0), logic.get("sys_cap", ""), kind="logic", extra_fields=logic)
-                widgets.logic_list.addItem(item)
-                widgets.logic_list.attach_chip(item)
-
-            for act in sifu_data.get("actuators", []):
-                if act.get("architecture") == "1oo2":
-                    grp_item = self._create_group_item(act, "actuator")
-                    widgets.out_list.addItem(grp_item)
-                    widgets.out_list.attach_chip(grp_item)
-                else:
-                    item = self._make_item(act.get("code", "?"), act.get("pfd_avg", 0.0), act.get("pfh_avg", 0.0), act.get("sys_cap", ""), act.get("pdm_code", ""), kind="actuator", extra_fields=act)
-                    widgets.out_list.addItem(item)
-                    widgets.out_list.attach_chip(item)
+        # Fill every row with table painting suspended; recalculate_all repaints once at the end.
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table.setRowCount(len(sifus))
+            for row_idx, sifu_data in enumerate(sifus):
+                req_sil_str, _ = normalize_required_sil(sifu_data.get("sil_required", "n.a."))
+                meta = RowMeta({
+                    "sifu_name": sifu_data.get("sifu_name", f"SIFU {row_idx+1}"),
+                    "sil_required": req_sil_str,
+                    "demand_mode_required": sifu_data.get("demand_mode_required", "High demand"),
+                    "demand_mode_override": sifu_data.get("demand_mode_override", None),
+                    "source": "user"
+                })
+                self.rows_meta.append(meta)
+                self._ensure_row_uid(meta)
+
+                self._set_row_header(row_idx)
+
+                widgets = SifuRowWidgets()
+                self.sifu_widgets[meta['_uid']] = widgets
+
+                effective = self._effective_demand_mode(row_idx)
+                widgets.result.combo.setCurrentText(effective)
+                widgets.result.override_changed.connect(lambda val, uid=meta['_uid']: self._on_row_override_changed(self._row_index_from_uid(uid), val))
+
+                self.table.setCellWidget(row_idx, 0, widgets.in_list)
+                self.table.setCellWidget(row_idx, 1, widgets.logic_list)
+                self.table.setCellWidget(row_idx, 2, widgets.out_list)
+                self.table.setCellWidget(row_idx, 3, widgets.result)
+
+                # Scope link group ids to the fresh row uid, so the first recalculation
+                # finds the payloads already in steady state.
+                for sensor in sifu_data.get("sensors", []):
+                    sensor = self._bind_link_to_row(sensor, meta['_uid'])
+                    if sensor.get("architecture") == "1oo2":
+                        item = self._create_group_item(sensor, "sensor")
+                        widgets.in_list.addItem(item)
+                        widgets.in_list.attach_chip(item)
+                    else:
+                        item = self._make_item(sensor.get("code", "?"), sensor.get("pfd_avg", 0.0), sensor.get("pfh_avg", 0.0), sensor.get("sys_cap", ""), sensor.get("pdm_code", ""), kind="sensor", extra_fields=sensor)
+                        widgets.in_list.addItem(item)
+                        widgets.in_list.attach_chip(item)
+
+                for logic in sifu_data.get("logic", []):
+                    logic = self._bind_link_to_row(logic, meta['_uid'])
+                    name = _pick(logic, "code", "name", "Logic")
+                    item = self._make_item(name, logic.get("pfd_avg", 0.0), logic.get("pfh_avg", 0.0), logic.get("sys_cap", ""), kind="logic", extra_fields=logic)
+                    widgets.logic_list.addItem(item)
+                    widgets.logic_list.attach_chip(item)
+
+                for act in sifu_data.get("actuators", []):
+                    act = self._bind_link_to_row(act, meta['_uid'])
+                    if act.get("architecture") == "1oo2":
+                        grp_item = self._create_group_item(act, "actuator")
+                        widgets.out_list.addItem(grp_item)
+                        widgets.out_list.attach_chip(grp_item)
+                    else:
+                        item = self._make_item(act.get("code", "?"), act.get("pfd_avg", 0.0), act.get("pfh_avg", 0.0), act.get("sys_cap", ""), act.get("pdm_code", ""), kind="actuator", extra_fields=act)
+                        widgets.out_list.addItem(item)
+                        widgets.out_list.attach_chip(item)
 
-            self._update_row_height(row_idx)
+                self._update_row_height(row_idx)
 
-        if self.table.columnCount() == 4:
-            self.table.setColumnWidth(0, 360); self.table.setColumnWidth(1, 300); self.table.setColumnWidth(2, 360)
+            if self.table.columnCount() == 4:
+                self.table.setColumnWidth(0, 360); self.table.setColumnWidth(1, 300); self.table.setColumnWidth(2, 360)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
         self.recalculate_all()
         self._reseed_link_counters()
 
     # ----- collect list items -----
     def _collect_list_items(self, lw: QListWidget, group_kind: str, mode_key: str) -> List[dict]:
+        # Entries (and 1oo2 members) always carry the canonical keys pfd_avg/pfh_avg;
+        # single components and members also sys_cap/pdm_code. Report code relies on it.
         items: List[dict] = []
         assumptions = self._current_assumptions()
         du_ratio, dd_ratio = self._ratios(group_kind)
-        row_idx, _ = self._row_lane_for_list(lw)
-        row_uid = self._row_uid_for_index(row_idx) if row_idx >= 0 else None
+        row_uid, _ = self._row_uid_lane_for_list(lw)
+        # Link group ids only exist for rows with a uid; bind the row once per list.
+        group_id_for = partial(self._group_id_for_color, row_uid) if row_uid else None
 
-        for i in range(lw.count()):
-            item = lw.item(i)
+        for item in [lw.item(i) for i in range(lw.count())]:
             if not item:
                 continue
-            payload = item.data(Qt.UserRole) or {}
+            payload = item.data(_USER_ROLE) or {}
             if payload.get('group') and payload.get('architecture') == '1oo2':
                 normalized_members: List[dict] = []
                 group_link_color = self._sanitize_link_color(payload.get('link_color'))
                 for member in payload.get('members', []):
                     if isinstance(member, dict):
-                        member_copy = copy.deepcopy(member)
-                        member_id = member_copy.get('instance_id')
+                        # Only clone members that actually need a fresh instance id.
+                        member_id = member.get('instance_id')
                         if not isinstance(member_id, str) or not member_id:
-                            member_id = new_instance_id()
-                            member_copy['instance_id'] = member_id
-                        normalized_members.append(member_copy)
+                            member = dict(member)
+                            member['instance_id'] = new_instance_id()
+                        normalized_members.append(member)
                 if normalized_members != payload.get('members'):
-                    new_payload = copy.deepcopy(payload)
+                    new_payload = dict(payload)
                     new_payload['members'] = normalized_members
-                    item.setData(Qt.UserRole, new_payload)
+                    item.setData(_USER_ROLE, new_payload)
                     payload = new_payload
 
                 metrics, _, member_infos, errors = self._group_metrics(
@@ -3774,17 +4166,16 @@ class MainWindow(QMainWindow):
 
                 members_payload: List[dict] = []
                 for info in member_infos:
-                    member_payload = copy.deepcopy(info['payload'])
+                    member_payload = info['payload']
                     member_id = member_payload.get('instance_id')
                     if not isinstance(member_id, str) or not member_id:
                         member_id = new_instance_id()
-                        member_payload['instance_id'] = member_id
                     member_entry = {
                         'code': member_payload.get('code'),
                         'name': member_payload.get('name'),
-                        'pfd_avg': float(member_payload.get('pfd', member_payload.get('pfd_avg', 0.0)) or 0.0),
-                        'pfh_avg': float(member_payload.get('pfh', member_payload.get('pfh_avg', 0.0)) or 0.0),
-                        'sys_cap': member_payload.get('sys_cap', member_payload.get('syscap', '')),
+                        'pfd_avg': float(_pick(member_payload, 'pfd', 'pfd_avg', 0.0) or 0.0),
+                        'pfh_avg': float(_pick(member_payload, 'pfh', 'pfh_avg', 0.0) or 0.0),
+                        'sys_cap': _pick(member_payload, 'sys_cap', 'syscap', ''),
                         'pdm_code': member_payload.get('pdm_code'),
                         'instance_id': member_id,
                         'provenance': info['provenance'],
@@ -3803,16 +4194,16 @@ class MainWindow(QMainWindow):
                 }
                 if group_link_color:
                     entry['link_color'] = group_link_color
-                    if row_uid:
-                        entry['link_group_id'] = self._group_id_for_color(row_uid, group_link_color)
+                    if group_id_for:
+                        entry['link_group_id'] = group_id_for(group_link_color)
                 items.append(entry)
             else:
                 inst_id = payload.get('instance_id')
                 if not isinstance(inst_id, str) or not inst_id:
                     inst_id = new_instance_id()
-                    payload = copy.deepcopy(payload)
+                    payload = dict(payload)
                     payload['instance_id'] = inst_id
-                    item.setData(Qt.UserRole, payload)
+                    item.setData(_USER_ROLE, payload)
 
                 metrics, provenance, _, error = self._component_metrics(
                     payload,
@@ -3828,9 +4219,9 @@ class MainWindow(QMainWindow):
                 entry = {
                     'code': payload.get('code') or payload.get('name'),
                     'name': payload.get('name'),
-                    'pfd_avg': float(payload.get('pfd', payload.get('pfd_avg', 0.0)) or 0.0),
-                    'pfh_avg': float(payload.get('pfh', payload.get('pfh_avg', 0.0)) or 0.0),
-                    'sys_cap': payload.get('syscap', payload.get('sys_cap', '')),
+                    'pfd_avg': float(_pick(payload, 'pfd', 'pfd_avg', 0.0) or 0.0),
+                    'pfh_avg': float(_pick(payload, 'pfh', 'pfh_avg', 0.0) or 0.0),
+                    'sys_cap': _pick(payload, 'syscap', 'sys_cap', ''),
                     'pdm_code': payload.get('pdm_code', ''),
                     'kind': payload.get('kind'),
                     'instance_id': inst_id,
@@ -3839,8 +4230,8 @@ class MainWindow(QMainWindow):
                 link_color = self._sanitize_link_color(payload.get('link_color'))
                 if link_color:
                     entry['link_color'] = link_color
-                    if row_uid:
-                        entry['link_group_id'] = self._group_id_for_color(row_uid, link_color)
+                    if group_id_for:
+                        entry['link_group_id'] = group_id_for(link_color)
                 items.append(entry)
         return items
 
@@ -3851,26 +4242,33 @@ class MainWindow(QMainWindow):
 
     # ----- sums + display (math unchanged) -----
     def _ratios(self, group: str) -> Tuple[float, float]:
+        cached = self._ratios_cache.get(group)
+        if cached is not None:
+            return cached
         du, dd = self.du_dd_ratios.get(group, (0.6, 0.4))
         tot = du + dd
-        if tot <= 0: return 0.6, 0.4
-        return du / tot, dd / tot
+        ratios = (0.6, 0.4) if tot <= 0 else (du / tot, dd / tot)
+        self._ratios_cache[group] = ratios
+        return ratios
 
     def _current_assumptions(self) -> Assumptions:
-        return Assumptions(
-            TI=float(self.assumptions['TI']),
-            MTTR=float(self.assumptions['MTTR']),
-            beta=float(self.assumptions['beta']),
-            beta_D=float(self.assumptions['beta_D']),
-        )
+        if self._assumptions_cache is None:
+            self._assumptions_cache = Assumptions(
+                TI=float(self.assumptions['TI']),
+                MTTR=float(self.assumptions['MTTR']),
+                beta=float(self.assumptions['beta']),
+                beta_D=float(self.assumptions['beta_D']),
+            )
+        return self._assumptions_cache
+
+    def _invalidate_config_cache(self) -> None:
+        """Drop the cached Assumptions/ratio snapshots after the configuration changed."""
+        self._assumptions_cache = None
+        self._ratios_cache.clear()
 
     @staticmethod
     def _note_for_provenance(provenance: Optional[str]) -> Optional[str]:
-        if provenance == "derived_from_pfh":
-            return "Data source: λ_total derived from PFH; DU/DD use the current settings."
-        if provenance == "derived_from_pfd":
-            return "Data source: λ_total derived from 2·PFD/TI using the current TI; DU/DD use the current settings."
-        return None
+        return _PROVENANCE_NOTES.get(provenance)
 
     def _handle_conversion_error(self, message: str) -> None:
         if not message:
@@ -3895,9 +4293,9 @@ class MainWindow(QMainWindow):
         metrics = calculate_single_channel(lambda_total, du_ratio, dd_ratio, assumptions)
         note = self._note_for_provenance(provenance)
         title = payload.get('code') or payload.get('name') or "Component"
-        pfd_val = payload.get('pfd', payload.get('pfd_avg'))
-        pfh_val = payload.get('pfh', payload.get('pfh_avg'))
-        syscap = payload.get('syscap', payload.get('sys_cap', ''))
+        pfd_val = _pick(payload, 'pfd', 'pfd_avg')
+        pfh_val = _pick(payload, 'pfh', 'pfh_avg')
+        syscap = _pick(payload, 'syscap', 'sys_cap', '')
         tooltip = make_html_tooltip(
             str(title),
             pfd_val,
@@ -3923,8 +4321,6 @@ class MainWindow(QMainWindow):
         lambda_values: List[float] = []
         errors: List[str] = []
         for member in members:
-            if not isinstance(member, dict):
-                continue
             try:
                 lam, provenance = compute_lambda_total(member, mode_key, assumptions)
             except ConversionError as exc:
@@ -3939,8 +4335,7 @@ class MainWindow(QMainWindow):
         return metrics, tooltip, member_infos, errors
 
     def _format_group_tooltip(self, member_infos: List[Dict[str, Any]], metrics: ChannelMetrics) -> str:
-        def esc(x: Any) -> str:
-            return html.escape('' if x is None else str(x))
+        esc = escape_html
 
         def fmt_pfd(x: Optional[float]) -> str:
             try:
@@ -3963,8 +4358,8 @@ class MainWindow(QMainWindow):
         rows = []
         for idx, info in enumerate(member_infos):
             member_payload = info.get('payload', {})
-            pfd_val = member_payload.get('pfd', member_payload.get('pfd_avg'))
-            pfh_val = member_payload.get('pfh', member_payload.get('pfh_avg'))
+            pfd_val = _pick(member_payload, 'pfd', 'pfd_avg')
+            pfh_val = _pick(member_payload, 'pfh', 'pfh_avg')
             note = self._note_for_provenance(info.get('provenance'))
             rows.append(
                 f"<tr><td>{esc(labels[idx])}</td><td>{fmt_pfd(pfd_val)}</td><td>{fmt_pfh(pfh_val)}</td></tr>"
@@ -4005,16 +4400,7 @@ class MainWindow(QMainWindow):
         pfh_sum = 0.0
         assumptions = self._current_assumptions()
 
-        def group_of(idx: int) -> str:
-            return ('sensor', 'logic', 'actuator')[idx]
-
-        lane_title_map = {
-            'sensor': 'Sensors / Inputs',
-            'logic': 'Logic',
-            'actuator': 'Outputs / Actuators',
-        }
-
-        subgroup_totals: Dict[str, Dict[str, Any]] = {}
+        subgroup_totals: Dict[str, Dict[str, Any]] = defaultdict(_new_subgroup_entry)
         lane_totals: Dict[str, Dict[str, float]] = {
             'sensor': {'pfd': 0.0, 'pfh': 0.0},
             'logic': {'pfd': 0.0, 'pfh': 0.0},
@@ -4025,8 +4411,6 @@ class MainWindow(QMainWindow):
             if payload.get('group') and payload.get('architecture') == '1oo2':
                 member_labels: List[str] = []
                 for m_idx, member in enumerate(payload.get('members', [])):
-                    if not isinstance(member, dict):
-                        continue
                     label = member.get('code') or member.get('name') or f"Member {m_idx + 1}"
                     member_labels.append(str(label))
                 label = " ∥ ".join(lbl for lbl in member_labels if lbl) or default_label
@@ -4034,11 +4418,33 @@ class MainWindow(QMainWindow):
             label = payload.get('code') or payload.get('name') or default_label
             return str(label), []
 
-        for idx, lw in enumerate(lists):
-            group = group_of(idx)
+        def accumulate(
+            lane_total: Dict[str, float],
+            group: str,
+            link_group_id: Optional[str],
+            link_color: Optional[str],
+            pfd: float,
+            pfh: float,
+            component_info: Dict[str, Any],
+        ) -> None:
+            # Linked components count towards their subgroup, the rest towards their lane.
+            if not link_group_id:
+                lane_total['pfd'] += pfd
+                lane_total['pfh'] += pfh
+                return
+            entry = subgroup_totals[link_group_id]
+            if link_color and not entry['color']:
+                entry['color'] = link_color
+            entry['pfd'] += pfd
+            entry['pfh'] += pfh
+            entry['components'].append(component_info)
+            entry['lanes'] |= _LANE_BITS[group]
+
+        # lane_totals is ordered like `lists` (sensor, logic, actuator).
+        for (group, lane_total), lw in zip(lane_totals.items(), lists):
+            lane_title = _LANE_TITLES.get(group, group.title())
             du_ratio, dd_ratio = self._ratios(group)
-            lane_row_idx, _ = self._row_lane_for_list(lw)
-            row_uid = self._row_uid_for_index(lane_row_idx) if lane_row_idx >= 0 else None
+            row_uid, _ = self._row_uid_lane_for_list(lw)
             for i in range(lw.count()):
                 item = lw.item(i)
                 if item is None:
@@ -4047,45 +4453,45 @@ class MainWindow(QMainWindow):
                 raw_group_id = ud.get('link_group_id')
                 link_group_id = self._normalize_link_group_id(raw_group_id)
                 if link_group_id and raw_group_id != link_group_id:
-                    updated_payload = copy.deepcopy(ud)
+                    updated_payload = dict(ud)
                     updated_payload['link_group_id'] = link_group_id
                     item.setData(Qt.UserRole, updated_payload)
                     ud = updated_payload
                 elif raw_group_id and not link_group_id:
-                    updated_payload = copy.deepcopy(ud)
+                    updated_payload = dict(ud)
                     updated_payload.pop('link_group_id', None)
                     item.setData(Qt.UserRole, updated_payload)
                     ud = updated_payload
 
                 link_color = self._sanitize_link_color(ud.get('link_color'))
                 if link_color and ud.get('link_color') != link_color:
-                    updated_payload = copy.deepcopy(ud)
+                    updated_payload = dict(ud)
                     updated_payload['link_color'] = link_color
                     item.setData(Qt.UserRole, updated_payload)
                     ud = updated_payload
                 elif ud.get('link_color') and not link_color:
-                    updated_payload = copy.deepcopy(ud)
+                    updated_payload = dict(ud)
                     updated_payload.pop('link_color', None)
                     item.setData(Qt.UserRole, updated_payload)
                     ud = updated_payload
                 if link_color and row_uid:
                     expected_group_id = self._group_id_for_color(row_uid, link_color)
                     if link_group_id != expected_group_id:
-                        updated_payload = copy.deepcopy(ud)
+                        updated_payload = dict(ud)
                         updated_payload['link_group_id'] = expected_group_id
                         updated_payload['link_color'] = link_color
                         item.setData(Qt.UserRole, updated_payload)
                         ud = updated_payload
                         link_group_id = expected_group_id
                 elif not link_color and link_group_id:
-                    updated_payload = copy.deepcopy(ud)
+                    updated_payload = dict(ud)
                     updated_payload.pop('link_group_id', None)
                     item.setData(Qt.UserRole, updated_payload)
                     ud = updated_payload
                     link_group_id = None
 
                 if ud.get('group') and ud.get('architecture') == '1oo2':
-                    members = [m for m in ud.get('members', []) if isinstance(m, dict)]
+                    members = ud.get('members') or []
                     metrics, tooltip, _, errors = self._group_metrics(
                         members,
                         du_ratio,
@@ -4095,88 +4501,35 @@ class MainWindow(QMainWindow):
                     )
                     for err in errors:
                         self._handle_conversion_error(err)
+                    architecture = '1oo2'
+                else:
+                    metrics, _, tooltip, error = self._component_metrics(
+                        ud,
+                        du_ratio,
+                        dd_ratio,
+                        mode_key,
+                        assumptions,
+                    )
+                    if error:
+                        self._handle_conversion_error(error)
+                        continue
+                    architecture = ud.get('architecture')
 
-                    metrics_pfd = float(metrics.pfd)
-                    metrics_pfh = float(metrics.pfh)
-                    label, member_labels = describe_payload(ud, item.text() or 'Component')
-                    component_info = {
-                        'label': label,
-                        'member_labels': member_labels,
-                        'architecture': '1oo2',
-                        'kind': ud.get('kind', group),
-                        'lane': group,
-                        'lane_title': lane_title_map.get(group, group.title()),
-                        'color': link_color,
-                    }
-
-                    if link_group_id:
-                        entry = subgroup_totals.setdefault(
-                            link_group_id,
-                            {
-                                'color': link_color,
-                                'pfd': 0.0,
-                                'pfh': 0.0,
-                                'components': [],
-                                'lanes': set(),
-                            },
-                        )
-                        if link_color and not entry.get('color'):
-                            entry['color'] = link_color
-                        entry['pfd'] += metrics_pfd
-                        entry['pfh'] += metrics_pfh
-                        entry['components'].append(component_info)
-                        entry['lanes'].add(group)
-                    else:
-                        lane_totals[group]['pfd'] += metrics_pfd
-                        lane_totals[group]['pfh'] += metrics_pfh
-
-                    item.setToolTip(tooltip)
-                    continue
-
-                metrics, _, tooltip, error = self._component_metrics(
-                    ud,
-                    du_ratio,
-                    dd_ratio,
-                    mode_key,
-                    assumptions,
-                )
-                if error:
-                    self._handle_conversion_error(error)
-                    continue
-
+                # Cast once here; every total below is a running sum of these floats.
                 metrics_pfd = float(metrics.pfd)
                 metrics_pfh = float(metrics.pfh)
                 label, member_labels = describe_payload(ud, item.text() or 'Component')
+                # Same shape as the serialized subgroup component entries.
                 component_info = {
                     'label': label,
+                    'lane': group,
+                    'lane_title': lane_title,
+                    'architecture': architecture,
                     'member_labels': member_labels,
-                    'architecture': ud.get('architecture'),
                     'kind': ud.get('kind', group),
-                    'lane': group,
-                    'lane_title': lane_title_map.get(group, group.title()),
                     'color': link_color,
                 }
-
-                if link_group_id:
-                    entry = subgroup_totals.setdefault(
-                        link_group_id,
-                        {
-                            'color': link_color,
-                            'pfd': 0.0,
-                            'pfh': 0.0,
-                            'components': [],
-                            'lanes': set(),
-                        },
-                    )
-                    if link_color and not entry.get('color'):
-                        entry['color'] = link_color
-                    entry['pfd'] += metrics_pfd
-                    entry['pfh'] += metrics_pfh
-                    entry['components'].append(component_info)
-                    entry['lanes'].add(group)
-                else:
-                    lane_totals[group]['pfd'] += metrics_pfd
-                    lane_totals[group]['pfh'] += metrics_pfh
+                accumulate(lane_total, group, link_group_id, link_color, metrics_pfd, metrics_pfh, component_info)
 
                 if tooltip:
                     item.setToolTip(tooltip)
@@ -4187,32 +4540,17 @@ class MainWindow(QMainWindow):
             for group_id, info in subgroup_totals.items():
                 pfd_sum += info['pfd']
                 pfh_sum += info['pfh']
-                comp_entries: List[Dict[str, Any]] = []
-                labels: List[str] = []
-                for comp in info['components']:
-                    if not isinstance(comp, dict):
-                        continue
-                    label_val = comp.get('label')
-                    if label_val:
-                        labels.append(label_val)
-                    comp_entries.append({
-                        'label': label_val,
-                        'lane': comp.get('lane'),
-                        'lane_title': comp.get('lane_title') or lane_title_map.get(comp.get('lane'), comp.get('lane', '')),
-                        'architecture': comp.get('architecture'),
-                        'member_labels': comp.get('member_labels', []),
-                        'kind': comp.get('kind'),
-                        'color': comp.get('color', info.get('color')),
-                    })
-                lanes = sorted(info.get('lanes', set()))
+                # component_info dicts are built fresh above in their final shape.
+                comp_entries: List[Dict[str, Any]] = info['components']
+                labels = [comp['label'] for comp in comp_entries if comp['label']]
                 combined_payload.append({
                     'id': group_id,
                     'color': info.get('color'),
-                    'pfd': float(info['pfd']),
-                    'pfh': float(info['pfh']),
+                    'pfd': info['pfd'],
+                    'pfh': info['pfh'],
                     'components': comp_entries,
                     'member_labels': labels,
-                    'lanes': [lane_title_map.get(lane, lane) for lane in lanes],
+                    'lanes': list(_LANE_MASK_TITLES[info['lanes']]),
                     'count': len(comp_entries),
                 })
             subgroup_payload['combined'] = combined_payload
@@ -4226,10 +4564,12 @@ class MainWindow(QMainWindow):
     # ----- recalc & UI update -----
     def recalculate_row(self, row_idx: int):
         if row_idx < 0 or row_idx >= len(self.rows_meta): return
-        widgets = self.sifu_widgets.get(row_idx)
+        self._row_haystack_cache.pop(self._ensure_row_uid(self.rows_meta[row_idx]), None)
+        self._last_filter_state = None
+        widgets = self._widgets_for_row(row_idx)
         if not widgets: return  # can happen after remove
         mode = self._effective_demand_mode(row_idx)
-        mode_key = "low_demand" if "low" in mode.lower() else "high_demand"
+        mode_key = demand_mode_key(mode)
         pfd_sum, pfh_sum, subgroup_info = self._sum_lists(
             (widgets.in_list, widgets.logic_list, widgets.out_list),
             mode_key,
@@ -4265,72 +4605,40 @@ class MainWindow(QMainWindow):
             f"Calculated: {sil_calc}",
             f"{metric_caption}: {metric_value}",
         ]
-
-        combined_groups = []
-        if isinstance(subgroup_info, dict):
-            combined_groups = subgroup_info.get('combined', []) or []
-
-        if combined_groups:
-            def fmt_optional_pfd(value: Optional[float]) -> str:
-                if value is None:
-                    return ""
-                try:
-                    return f"PFDavg {float(value):.6f}"
-                except Exception:
-                    return ""
-
-            def fmt_optional_pfh(value: Optional[float]) -> str:
-                if value is None:
-                    return ""
-                try:
-                    return f"PFHavg {float(value):.3e} 1/h"
-                except Exception:
-                    return ""
-
-            tooltip_lines.append("")
-            tooltip_lines.append("Link subgroups:")
-            for idx, subgroup in enumerate(combined_groups, 1):
-                if not isinstance(subgroup, dict):
-                    continue
-                header_bits = [f"  Subgroup {idx}"]
-                lanes = subgroup.get('lanes')
-                if isinstance(lanes, (list, tuple)) and lanes:
-                    header_bits.append(f"[{', '.join(str(l) for l in lanes if l)}]")
-                tooltip_lines.append(" ".join(header_bits))
-
-                metric_bits: List[str] = []
-                pfd_txt = fmt_optional_pfd(subgroup.get('pfd'))
-                if pfd_txt:
-                    metric_bits.append(pfd_txt)
-                pfh_txt = fmt_optional_pfh(subgroup.get('pfh'))
-                if pfh_txt:
-                    metric_bits.append(pfh_txt)
-                if metric_bits:
-                    tooltip_lines.append("    " + " | ".join(metric_bits))
-
-                members = subgroup.get('member_labels')
-                if not members:
-                    members = [
-                        comp.get('label')
-                        for comp in subgroup.get('components', [])
-                        if isinstance(comp, dict) and comp.get('label')
-                    ]
-                if members:
-                    tooltip_lines.append(
-                        "    Members: " + ", ".join(str(lbl) for lbl in members if lbl)
-                    )
-
-        widgets.result.setToolTip("\n".join(tooltip_lines))
+        # Built on first hover only; rows recalculated while hidden or never hovered skip it.
+        widgets.result.set_lazy_tooltip(
+            partial(_result_tooltip_text, tooltip_lines, subgroup_info.get('combined') or [])
+        )
 
         self._update_row_height(row_idx)
         # refresh 1oo2 tooltips
         self._refresh_group_tooltips_in_row(row_idx)
         self._schedule_filter_update()
 
+    def _schedule_recalculate(self, reseed_links: bool = False) -> None:
+        """Run recalculate_all (and optionally _reseed_link_counters) once on the next event-loop turn."""
+        self._reseed_pending = self._reseed_pending or reseed_links
+        if self._recalc_pending:
+            return
+        self._recalc_pending = True
+        QtCore.QTimer.singleShot(0, self._flush_recalculate)
+
+    def _flush_recalculate(self) -> None:
+        reseed = self._reseed_pending
+        self._recalc_pending = self._reseed_pending = False
+        self.recalculate_all()
+        if reseed:
+            self._reseed_link_counters()
+
     def recalculate_all(self):
-        for row_idx in range(self.table.rowCount()):
-            self.recalculate_row(row_idx)
-        self._reapply_sifu_filter()
+        # Batch the per-row result/height updates into a single repaint.
+        self.table.setUpdatesEnabled(False)
+        try:
+            for row_idx in range(self.table.rowCount()):
+                self.recalculate_row(row_idx)
+            self._reapply_sifu_filter()
+        finally:
+            self.table.setUpdatesEnabled(True)
 
     # ----- SIFU filter helpers -----
     def _schedule_filter_update(self, _text: str = "") -> None:
@@ -4349,8 +4657,13 @@ class MainWindow(QMainWindow):
     def _apply_sifu_filter(self, text: str) -> None:
         if not hasattr(self, "table"):
             return
-        tokens = [tok.casefold() for tok in re.split(r"\s+", text.strip()) if tok]
+        tokens = [tok.casefold() for tok in text.split()]
         total = self.table.rowCount()
+        # Debounced re-triggers often carry the same text; rows only change via recalculate_row.
+        state = (tuple(tokens), total)
+        if state == self._last_filter_state:
+            return
+        self._last_filter_state = state
         matches = 0
         for row_idx in range(total):
             visible = True
@@ -4370,21 +4683,36 @@ class MainWindow(QMainWindow):
             else:
                 suffix = "SIFU" if total == 1 else "SIFUs"
                 status = f"{total} {suffix}"
-            self.sifu_filter_info.setText(status)
-            self.sifu_filter_info.setProperty("filtered", bool(tokens))
-            self.sifu_filter_info.style().unpolish(self.sifu_filter_info)
-            self.sifu_filter_info.style().polish(self.sifu_filter_info)
+            info = self.sifu_filter_info
+            if info.text() != status:
+                info.setText(status)
+            # Re-polishing re-evaluates the stylesheet; only do it when the state flips.
+            filtered = bool(tokens)
+            if info.property("filtered") != filtered:
+                info.setProperty("filtered", filtered)
+                info.style().unpolish(info)
+                info.style().polish(info)
 
     def _row_filter_haystack(self, row_idx: int) -> str:
+        # The row number is appended outside the cache because it shifts when rows are
+        # removed; tokens never contain spaces, so part order does not affect matching.
+        row_no = str(row_idx + 1)
+        if not 0 <= row_idx < len(self.rows_meta):
+            return row_no
+        uid = self._ensure_row_uid(self.rows_meta[row_idx])
+        cached = self._row_haystack_cache.get(uid)
+        if cached is None:
+            cached = self._row_haystack_cache[uid] = self._build_row_haystack(row_idx)
+        return f"{cached} {row_no}"
+
+    def _build_row_haystack(self, row_idx: int) -> str:
         parts: List[str] = []
-        if 0 <= row_idx < len(self.rows_meta):
-            meta = self.rows_meta[row_idx]
-            for key in ("sifu_name", "sil_required", "demand_mode_required", "demand_mode_override"):
-                val = meta.get(key)
-                if val:
-                    parts.append(str(val))
-        parts.append(str(row_idx + 1))
-        widgets = self.sifu_widgets.get(row_idx)
+        meta = self.rows_meta[row_idx]
+        for key in ("sifu_name", "sil_required", "demand_mode_required", "demand_mode_override"):
+            val = meta.get(key)
+            if val:
+                parts.append(str(val))
+        widgets = self._widgets_for_row(row_idx)
         if widgets:
             lists = (widgets.in_list, widgets.logic_list, widgets.out_list)
             for lw in lists:
@@ -4435,7 +4763,7 @@ class MainWindow(QMainWindow):
         )
 
     def _update_row_height(self, row_idx: int) -> None:
-        widgets = self.sifu_widgets.get(row_idx)
+        widgets = self._widgets_for_row(row_idx)
         if not widgets: return
         self.table.setRowHeight(row_idx, self._row_preferred_height(widgets))
 
@@ -4490,6 +4818,32 @@ class MainWindow(QMainWindow):
 
     # ----- New Project / Add / Remove SIFU -----
 
+    def _sync_sifu_actions(self) -> None:
+        """Refresh the row-bound actions; EnhancedMainWindow owns them."""
+        pass
+
+    def _clear_sifu_rows(self) -> None:
+        """Drop every SIFU row with a single relayout/repaint at the end."""
+        table = self.table
+        header = table.verticalHeader()
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        header.setUpdatesEnabled(False)
+        try:
+            # Bottom-up removal avoids shifting the remaining rows on every step.
+            for r in range(table.rowCount() - 1, -1, -1):
+                table.removeRow(r)
+            self.rows_meta.clear(); self.sifu_widgets.clear()
+            self._row_haystack_cache.clear()
+            self._last_filter_state = None
+        finally:
+            header.setUpdatesEnabled(True)
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+        table.viewport().update()
+        # currentCellChanged was blocked above, so refresh the action state by hand.
+        self._sync_sifu_actions()
+
     def _new_project_impl(self):
         """Actual implementation for 'New Project'. Used by fallback as well."""
         if self.table.rowCount() == 0:
@@ -4504,10 +4858,8 @@ class MainWindow(QMainWindow):
         self._end_link_session(silent=True)
         self._link_session_counters.clear()
         # Clear table & metadata (keep libraries)
-        self.table.clearContents(); self.table.setRowCount(0)
-        self.rows_meta.clear(); self.sifu_widgets.clear()
-        self.recalculate_all()
-        self._reseed_link_counters()
+        self._clear_sifu_rows()
+        self._schedule_recalculate(reseed_links=True)
         self.statusBar().showMessage("Project cleared", 1500)
 
     def _action_new_project_fallback(self):
@@ -4524,10 +4876,8 @@ class MainWindow(QMainWindow):
         self._end_link_session(silent=True)
         self._link_session_counters.clear()
         # Clear table & metadata (keep libraries)
-        self.table.clearContents(); self.table.setRowCount(0)
-        self.rows_meta.clear(); self.sifu_widgets.clear()
-        self.recalculate_all()
-        self._reseed_link_counters()
+        self._clear_sifu_rows()
+        self._schedule_recalculate(reseed_links=True)
         self.statusBar().showMessage("Project cleared", 1500)
 
     def _action_new_project(self):
@@ -4541,13 +4891,16 @@ class MainWindow(QMainWindow):
         if reply != QMessageBox.Yes:
             return
         # Clear table & metadata (keep libraries)
-        self.table.clearContents(); self.table.setRowCount(0)
-        self.rows_meta.clear(); self.sifu_widgets.clear()
-        self.recalculate_all()
+        self._clear_sifu_rows()
+        self._schedule_recalculate()
         self.statusBar().showMessage("Project cleared", 1500)
 
     def _action_add_sifu(self):
-        dlg = AddSifuDialog(self)
+        dlg = self._add_sifu_dlg
+        if dlg is None:
+            dlg = self._add_sifu_dlg = AddSifuDialog(self)
+        else:
+            dlg.reset()
         if dlg.exec_():
             meta = dlg.get_values()
             self._append_sifu_row(meta)
@@ -4557,12 +4910,8 @@ class MainWindow(QMainWindow):
         row = self.table.currentRow()
         if row < 0 or row >= self.table.rowCount():
             return
-        widgets = self.sifu_widgets.get(row)
-        non_empty = any([
-            widgets.in_list.count() > 0,
-            widgets.logic_list.count() > 0,
-            widgets.out_list.count() > 0
-        ])
+        widgets = self._widgets_for_row(row)
+        non_empty = bool(widgets) and widgets.is_non_empty()
         if non_empty:
             r = QMessageBox.question(
                 self, "Remove SIFU",
@@ -4576,32 +4925,22 @@ class MainWindow(QMainWindow):
             self._end_link_session(silent=True)
         if row_uid:
             self._link_session_counters.pop(row_uid, None)
-        # Remove row from UI and metadata
-        self.table.removeRow(row)
+        # Remove row from UI and metadata. Widgets are keyed by row uid and the
+        # header items move with their rows, so nothing else needs re-indexing.
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            self.table.removeRow(row)
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
         self.rows_meta.pop(row)
-        self.sifu_widgets.pop(row, None)
-
-        # Rebuild headers and indices mapping
-        new_map = {}
-        for i in range(self.table.rowCount()):
-            in_list = self.table.cellWidget(i, 0)
-            logic   = self.table.cellWidget(i, 1)
-            out_list= self.table.cellWidget(i, 2)
-            result  = self.table.cellWidget(i, 3)
-            if in_list and logic and out_list and result:
-                # try reuse existing instance
-                w = self.sifu_widgets.get(i)
-                if not w:
-                    w = SifuRowWidgets()
-                    w.in_list = in_list; w.logic_list = logic; w.out_list = out_list; w.result = result
-                new_map[i] = w
-                meta = self.rows_meta[i]
-                header = f"{meta['sifu_name']} SIL req {meta['sil_ required'] if 'sil_ required' in meta else meta['sil_required']} {meta['demand_mode_required']}"
-                header = header.replace("sil_ required","sil_required")
-                self.table.setVerticalHeaderItem(i, QTableWidgetItem(header))
-        self.sifu_widgets = new_map
-        self.recalculate_all()
-        self._reseed_link_counters()
+        if row_uid:
+            self.sifu_widgets.pop(row_uid, None)
+            self._row_haystack_cache.pop(row_uid, None)
+        # The current-cell change was blocked along with removeRow's other signals.
+        self._sync_sifu_actions()
+        self._schedule_recalculate(reseed_links=True)
         self.statusBar().showMessage("SIFU removed", 1500)
 
     def _action_edit_sifu(self):
@@ -4615,15 +4954,19 @@ class MainWindow(QMainWindow):
     def _edit_sifu_at_row(self, row_idx: int):
         if row_idx < 0 or row_idx >= len(self.rows_meta): return
         meta = self.rows_meta[row_idx]
-        dlg = EditSifuDialog(meta, self)
+        dlg = self._edit_sifu_dlg
+        if dlg is None:
+            dlg = self._edit_sifu_dlg = EditSifuDialog(meta, self)
+        else:
+            dlg.set_meta(meta)
         if dlg.exec_():
             new_meta = dlg.get_values()
             meta["sifu_name"] = new_meta["sifu_name"]
             meta["sil_required"] = new_meta["sil_required"]
             meta["demand_mode_required"] = new_meta["demand_mode_required"]
-            header = f"{meta['sifu_name']} \nRequired: {meta['sil_required']}\n {meta['demand_mode_required']}"
-            self.table.setVerticalHeaderItem(row_idx, QTableWidgetItem(header))
-            widgets = self.sifu_widgets.get(row_idx)
+            if not self._set_row_header(row_idx):
+                return  # nothing changed
+            widgets = self._widgets_for_row(row_idx)
             if widgets and not meta.get("demand_mode_override"):
                 widgets.result.combo.setCurrentText(meta["demand_mode_required"])
             self.recalculate_row(row_idx)
@@ -4637,14 +4980,13 @@ class MainWindow(QMainWindow):
         self._ensure_row_uid(meta)
 
         widgets = SifuRowWidgets()
-        self.sifu_widgets[row_idx] = widgets
+        self.sifu_widgets[meta['_uid']] = widgets
 
-        header = f"{meta['sifu_name']} \nRequired: {meta['sil_required']}\n {meta['demand_mode_required']}"
-        self.table.setVerticalHeaderItem(row_idx, QTableWidgetItem(header))
+        self._set_row_header(row_idx)
 
         effective = self._effective_demand_mode(row_idx)
         widgets.result.combo.setCurrentText(effective)
-        widgets.result.override_changed.connect(lambda val, r=row_idx: self._on_row_override_changed(r, val))
+        widgets.result.override_changed.connect(lambda val, uid=meta['_uid']: self._on_row_override_changed(self._row_index_from_uid(uid), val))
 
         self.table.setCellWidget(row_idx, 0, widgets.in_list)
         self.table.setCellWidget(row_idx, 1, widgets.logic_list)
@@ -4657,7 +4999,11 @@ class MainWindow(QMainWindow):
 
     # ----- Add Component dialog -----
     def open_add_component_dialog(self, pref_kind: Optional[str] = None, insert_into_row: bool = False):
-        dlg = AddComponentDialog(self, pref_kind=pref_kind)
+        dlg = self._add_comp_dlg
+        if dlg is None:
+            dlg = self._add_comp_dlg = AddComponentDialog(self, pref_kind=pref_kind)
+        else:
+            dlg.reset(pref_kind)
         if dlg.exec_():
             d = dlg.get_values()
             kind = d["kind"]
@@ -4742,12 +5088,19 @@ class EnhancedMainWindow(MainWindow):
         super().__init__(df)
         # Rebuild menus & toolbar (clear any pre-existing bars from base)
         self._recent_files = []
+        # QAction per recent path (plus the two fixed entries), reused across _rebuild_recent_menu calls
+        self._recent_actions: Dict[str, QAction] = {}
+        self._recent_empty_action = QAction('(Empty)', self); self._recent_empty_action.setEnabled(False)
+        self._recent_clear_action = QAction('Clear Recent', self)
+        self._recent_clear_action.triggered.connect(self._clear_recent_files)
         self._current_assignment_path = None
         try:
             self._load_recent_files()
         except Exception:
             self._recent_files = []
         self._rebuild_menubar()
+        # Stat the remembered files once the window is up, not in the constructor
+        QtCore.QTimer.singleShot(0, self._prune_missing_recent_files)
         #self._rebuild_toolbar()
         self._install_context_enablement()
         self._apply_qss_menu_toolbar_theme()
@@ -4765,11 +5118,11 @@ class EnhancedMainWindow(MainWindow):
         self.act_export_html = QAction('Export HTML', self); self.act_export_html.setShortcut('Ctrl+Shift+E')
         self.act_exit = QAction('Exit', self)
         # Icons
-        self.act_new.setIcon(self.style().standardIcon(self.style().SP_FileIcon))
-        self.act_open.setIcon(self.style().standardIcon(self.style().SP_DialogOpenButton))
-        self.act_save.setIcon(self.style().standardIcon(self.style().SP_DialogSaveButton))
-        self.act_save_as.setIcon(self.style().standardIcon(self.style().SP_DialogSaveButton))
-        self.act_export_html.setIcon(self.style().standardIcon(self.style().SP_ArrowRight))
+        self.act_new.setIcon(self._std_icon(QStyle.SP_FileIcon))
+        self.act_open.setIcon(self._std_icon(QStyle.SP_DialogOpenButton))
+        self.act_save.setIcon(self._std_icon(QStyle.SP_DialogSaveButton))
+        self.act_save_as.setIcon(self._std_icon(QStyle.SP_DialogSaveButton))
+        self.act_export_html.setIcon(self._std_icon(QStyle.SP_ArrowRight))
         # Wire
         self.act_new.triggered.connect(getattr(self, '_action_new_project', self._action_new_project_fallback))
         self.act_open.triggered.connect(self._file_open)
@@ -4811,19 +5164,26 @@ class EnhancedMainWindow(MainWindow):
         self.toggle_sensor = QAction('Sensor Library', self, checkable=True, checked=self.sensor_lib.isVisible())
         self.toggle_logic = QAction('Logic Library', self, checkable=True, checked=self.logic_lib.isVisible())
         self.toggle_act = QAction('Actuator Library', self, checkable=True, checked=self.act_lib.isVisible())
-        self.toggle_sensor.triggered.connect(lambda b: self.sensor_lib.setVisible(b))
-        self.toggle_logic.triggered.connect(lambda b: self.logic_lib.setVisible(b))
-        self.toggle_act.triggered.connect(lambda b: self.act_lib.setVisible(b))
-        # Keep menus in sync with dock visibility
-        self.sensor_lib.visibilityChanged.connect(lambda b: self.toggle_sensor.setChecked(b))
-        self.logic_lib.visibilityChanged.connect(lambda b: self.toggle_logic.setChecked(b))
-        self.act_lib.visibilityChanged.connect(lambda b: self.toggle_act.setChecked(b))
+        # Keep menus in sync with dock visibility. The docks outlive the menubar, so drop
+        # the sync slots of a previous build before connecting the new toggles.
+        for sig, slot in getattr(self, '_view_signal_connections', []):
+            try:
+                sig.disconnect(slot)
+            except TypeError:
+                pass
+        self._view_signal_connections = []
+        for toggle, dock in ((self.toggle_sensor, self.sensor_lib),
+                             (self.toggle_logic, self.logic_lib),
+                             (self.toggle_act, self.act_lib)):
+            toggle.triggered.connect(dock.setVisible)
+            dock.visibilityChanged.connect(toggle.setChecked)
+            self._view_signal_connections.append((dock.visibilityChanged, toggle.setChecked))
         m_view.addActions([self.toggle_sensor, self.toggle_logic, self.toggle_act])
 
         # Tools
         m_tools = mb.addMenu('&Tools')
         self.act_config = QAction('Configuration…', self); self.act_config.setShortcut('Ctrl+,')
-        self.act_config.setIcon(self.style().standardIcon(self.style().SP_FileDialogDetailedView))
+        self.act_config.setIcon(self._std_icon(QStyle.SP_FileDialogDetailedView))
         self.act_config.triggered.connect(self._open_config_dialog)
         m_tools.addAction(self.act_config)
         # Help
@@ -4843,13 +5203,15 @@ class EnhancedMainWindow(MainWindow):
 
     # ---------------------- Toolbar with split buttons (C) ----------------------
     def _rebuild_toolbar(self):
-        # Remove existing toolbars created by base
-        for tb in self.findChildren(QToolBar):
+        # Remove the toolbars added by a previous call (the base window adds none)
+        for tb in getattr(self, '_my_toolbars', []):
             self.removeToolBar(tb)
+            tb.deleteLater()
         tb = QToolBar('Actions', self)
         tb.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
         tb.setIconSize(QtCore.QSize(20, 20))
         self.addToolBar(tb)
+        self._my_toolbars: List[QToolBar] = [tb]
         # File group
         tb.addAction(self.act_new)
         tb.addAction(self.act_open)
@@ -4873,14 +5235,15 @@ class EnhancedMainWindow(MainWindow):
 
     # ---------------------- Context enablement (F) ----------------------
     def _install_context_enablement(self):
-        def _sync():
-            row = self.table.currentRow()
-            valid = (0 <= row < self.table.rowCount())
-            self.act_edit_sifu.setEnabled(valid)
-            self.act_dup_sifu.setEnabled(valid)
-            self.act_rem_sifu.setEnabled(valid)
-        self.table.currentCellChanged.connect(lambda *_: _sync())
-        _sync()
+        self.table.currentCellChanged.connect(lambda *_: self._sync_sifu_actions())
+        self._sync_sifu_actions()
+
+    def _sync_sifu_actions(self) -> None:
+        row = self.table.currentRow()
+        valid = (0 <= row < self.table.rowCount())
+        self.act_edit_sifu.setEnabled(valid)
+        self.act_dup_sifu.setEnabled(valid)
+        self.act_rem_sifu.setEnabled(valid)
 
     # ---------------------- Menu/Toolbar QSS (G) ----------------------
     def _apply_qss_menu_toolbar_theme(self):
@@ -4916,7 +5279,7 @@ class EnhancedMainWindow(MainWindow):
     def _file_open_direct(self, path: str):
         try:
             with open(path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_SafeLoader) or {}
             self._rebuild_from_payload(data)
             QMessageBox.information(self, 'Import', f'Imported from {path}.')
             self.statusBar().showMessage(f'Imported {os.path.basename(path)}', 2000)
@@ -4954,7 +5317,7 @@ class EnhancedMainWindow(MainWindow):
         try:
             rf = self.settings.value('recent_files', [])
             if isinstance(rf, list):
-                self._recent_files = [s for s in rf if isinstance(s, str) and os.path.exists(s)]
+                self._recent_files = [s for s in rf if isinstance(s, str)]
             else:
                 self._recent_files = []
         except Exception:
@@ -4971,26 +5334,39 @@ class EnhancedMainWindow(MainWindow):
         self._save_recent_files()
         self._rebuild_recent_menu()
 
+    def _prune_missing_recent_files(self):
+        """Drop recent-file entries whose file no longer exists (runs once after startup)."""
+        existing = [p for p in self._recent_files if os.path.exists(p)]
+        if existing != self._recent_files:
+            self._recent_files = existing
+            self._save_recent_files()
+            self._rebuild_recent_menu()
+
     def _rebuild_recent_menu(self):
         if not hasattr(self, '_recent_menu'):
             return
         self._recent_menu.clear()
-        if not self._recent_files:
-            dummy = QAction('(Empty)', self); dummy.setEnabled(False)
-            self._recent_menu.addAction(dummy)
-            return
+        actions: Dict[str, QAction] = {}
         for p in self._recent_files:
-            act = QAction(p, self)
-            act.triggered.connect(lambda _=None, path=p: self._file_open_direct(path))
+            act = self._recent_actions.pop(p, None)
+            if act is None:
+                act = QAction(p, self)
+                act.triggered.connect(lambda _=None, path=p: self._file_open_direct(path))
+            actions[p] = act
             self._recent_menu.addAction(act)
+        for stale in self._recent_actions.values():
+            stale.deleteLater()
+        self._recent_actions = actions
+        if not actions:
+            self._recent_menu.addAction(self._recent_empty_action)
+            return
         self._recent_menu.addSeparator()
-        clear_act = QAction('Clear Recent', self)
-        def _clear():
-            self._recent_files = []
-            self._save_recent_files()
-            self._rebuild_recent_menu()
-        clear_act.triggered.connect(_clear)
-        self._recent_menu.addAction(clear_act)
+        self._recent_menu.addAction(self._recent_clear_action)
+
+    def _clear_recent_files(self):
+        self._recent_files = []
+        self._save_recent_files()
+        self._rebuild_recent_menu()
 
 
 